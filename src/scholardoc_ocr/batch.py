@@ -31,7 +31,7 @@ from .types import OCREngine, PageStatus
 
 if TYPE_CHECKING:
     from .quality import QualityAnalyzer
-    from .types import FileResult
+    from .types import FileResult, PageResult
 
 logger = logging.getLogger(__name__)
 
@@ -246,6 +246,7 @@ def split_into_batches(
     flagged_pages: list[FlaggedPage],
     available_memory_gb: float,
     device: str,
+    max_pages: int | None = None,
 ) -> list[list[FlaggedPage]]:
     """Split flagged pages into memory-safe sub-batches.
 
@@ -256,6 +257,8 @@ def split_into_batches(
         flagged_pages: All flagged pages to process.
         available_memory_gb: Available system memory in GB.
         device: Device type ("mps", "cuda", "cpu").
+        max_pages: Optional upper bound on pages per sub-batch (one Surya
+            call), applied on top of the memory-derived size.
 
     Returns:
         List of sub-batches, each a list of FlaggedPage objects.
@@ -275,6 +278,8 @@ def split_into_batches(
 
     total_pages = len(flagged_pages)
     safe_batch_size = compute_safe_batch_size(total_pages, available_memory_gb, device)
+    if max_pages is not None:
+        safe_batch_size = max(1, min(safe_batch_size, max_pages))
 
     # If all pages fit in one batch, return single batch
     if safe_batch_size >= total_pages:
@@ -297,7 +302,9 @@ def split_into_batches(
 
 
 def collect_flagged_pages(
-    file_results: list[FileResult], input_paths: dict[str, Path]
+    file_results: list[FileResult],
+    input_paths: dict[str, Path],
+    flagged_by_file: dict[str, list[PageResult]] | None = None,
 ) -> list[FlaggedPage]:
     """Aggregate flagged pages from all file results for cross-file batching.
 
@@ -307,6 +314,9 @@ def collect_flagged_pages(
     Args:
         file_results: List of FileResult objects containing flagged pages.
         input_paths: Mapping from filename to input Path.
+        flagged_by_file: Optional precomputed mapping from filename to its
+            flagged pages. Avoids rescanning ``fr.pages`` when the caller
+            already has it.
 
     Returns:
         List of FlaggedPage objects ordered for combined PDF creation,
@@ -328,7 +338,12 @@ def collect_flagged_pages(
             logger.warning("No input path for %s, skipping flagged pages", fr.filename)
             continue
 
-        for page in fr.flagged_pages:
+        if flagged_by_file is not None and fr.filename in flagged_by_file:
+            file_flagged = flagged_by_file[fr.filename]
+        else:
+            file_flagged = fr.flagged_pages
+
+        for page in file_flagged:
             pages.append(
                 FlaggedPage(
                     file_result=fr,
@@ -373,25 +388,41 @@ def create_combined_pdf(flagged_pages: list[FlaggedPage], output_path: Path) ->
     # Sort by batch_index to ensure correct order
     sorted_pages = sorted(flagged_pages, key=lambda p: p.batch_index)
 
+    # Consecutive pages of one source go in with a single insert_pdf call
+    runs: list[tuple[Path, int, int]] = []
     for page in sorted_pages:
-        try:
-            with fitz.open(page.input_path) as source:
-                result_doc.insert_pdf(
-                    source,
-                    from_page=page.page_number,
-                    to_page=page.page_number,
+        if runs and runs[-1][0] == page.input_path and runs[-1][2] == page.page_number - 1:
+            runs[-1] = (page.input_path, runs[-1][1], page.page_number)
+        else:
+            runs.append((page.input_path, page.page_number, page.page_number))
+
+    # Keep each source open across its pages and its graft map alive
+    # (final=False): insert_pdf then remembers which objects it already
+    # copied from that document, so fonts and images shared between pages
+    # are written once instead of once per page
+    sources: dict[Path, fitz.Document] = {}
+    try:
+        for input_path, first, last in runs:
+            try:
+                source = sources.get(input_path)
+                if source is None:
+                    source = sources[input_path] = fitz.open(input_path)
+                result_doc.insert_pdf(source, from_page=first, to_page=last, final=False)
+            except Exception as exc:
+                logger.error(
+                    "Failed to extract pages %d-%d from %s: %s",
+                    first,
+                    last,
+                    input_path,
+                    exc,
                 )
-        except Exception as exc:
-            logger.error(
-                "Failed to extract page %d from %s: %s",
-                page.page_number,
-                page.input_path,
-                exc,
-            )
-            raise
+                raise
 
-    result_doc.save(output_path)
-    result_doc.close()
+        result_doc.save(output_path)
+    finally:
+        for source in sources.values():
+            source.close()
+        result_doc.close()
     logger.debug("Created combined PDF with %d pages at %s", len(flagged_pages), output_path)
 
 
@@ -466,8 +497,10 @@ def map_results_to_files(
     """
     page_texts = split_markdown_by_pages(surya_text, len(flagged_pages))
 
-    for fp in flagged_pages:
-        text = page_texts[fp.batch_index]
+    # batch_index is global across sub-batches; the combined PDF for this
+    # sub-batch holds its pages in batch_index order starting at page 0
+    ordered = sorted(flagged_pages, key=lambda p: p.batch_index)
+    for text, fp in zip(page_texts, ordered):
         result = analyzer.analyze(text)
 
         # Update the PageResult in the source FileResult
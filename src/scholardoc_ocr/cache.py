@@ -0,0 +1,123 @@
+"""Content-addressed cache of per-file pipeline results.
+
+Entries are keyed by the SHA-256 of the input PDF bytes combined with the
+pipeline settings that affect output, and live under
+``<output_dir>/.cache/<key>/``. Each entry holds the pickled FileResult plus
+the final ``.pdf`` and ``.txt`` artifacts, so re-running the pipeline on an
+unchanged PDF with the same settings skips Tesseract and Surya entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .types import FileResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when FileResult or artifact layout changes so stale entries are ignored.
+CACHE_VERSION = 2
+
+_RESULT_FILE = "result.pkl"
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file.
+
+    ``hashlib.file_digest`` reads into one reused buffer rather than
+    allocating a bytes object per chunk.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def cache_key(path: Path, settings: dict) -> str:
+    """Build a cache key from file contents and output-affecting settings.
+
+    Args:
+        path: Input PDF.
+        settings: JSON-serializable settings; key order does not matter.
+
+    Returns:
+        Hex digest identifying this (file, settings) combination.
+    """
+    h = hashlib.sha256()
+    h.update(file_digest(path).encode())
+    h.update(json.dumps({"version": CACHE_VERSION, **settings}, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """On-disk store of FileResult objects and their output artifacts.
+
+    Example:
+        >>> cache = ResultCache(output_dir / ".cache")
+        >>> key = cache_key(pdf, {"langs": "eng"})
+        >>> if (hit := cache.get(key)) is None:
+        ...     cache.put(key, result, [final_pdf, final_txt])
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def get(self, key: str) -> FileResult | None:
+        """Return the cached FileResult for *key*, or None on miss or corruption."""
+        result_path = self._entry_dir(key) / _RESULT_FILE
+        if not result_path.exists():
+            return None
+        try:
+            with open(result_path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            logger.warning("Ignoring unreadable cache entry %s", key, exc_info=True)
+            return None
+
+    def artifact(self, key: str, suffix: str) -> Path | None:
+        """Return the cached artifact with *suffix* (e.g. ``".pdf"``), if stored."""
+        path = self._entry_dir(key) / f"output{suffix}"
+        return path if path.exists() else None
+
+    def restore(self, key: str, dest_dir: Path, stem: str) -> dict[str, Path]:
+        """Copy cached artifacts to ``dest_dir / f"{stem}{suffix}"``.
+
+        Returns:
+            Mapping from suffix to restored path for each artifact present.
+        """
+        restored: dict[str, Path] = {}
+        for suffix in (".pdf", ".txt"):
+            src = self.artifact(key, suffix)
+            if src is not None:
+                dest = dest_dir / f"{stem}{suffix}"
+                shutil.copy(src, dest)
+                restored[suffix] = dest
+        return restored
+
+    def put(self, key: str, result: FileResult, artifacts: list[Path]) -> None:
+        """Store *result* and copies of *artifacts* under *key*.
+
+        The pickled result is written last (atomically), so a partially
+        written entry is never returned by :meth:`get`.
+        """
+        entry = self._entry_dir(key)
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            for src in artifacts:
+                if src.exists():
+                    shutil.copy(src, entry / f"output{src.suffix}")
+            tmp = entry / f"{_RESULT_FILE}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry / _RESULT_FILE)
+        except Exception:
+            logger.warning("Failed to write cache entry for %s", result.filename, exc_info=True)
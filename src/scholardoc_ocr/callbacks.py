@@ -36,6 +36,7 @@ class ModelEvent:
     model_name: str
     status: str
     time_seconds: float | None = None
+    dtype: str | None = None
 
 
 @runtime_checkable
@@ -44,6 +44,10 @@ class RichCallback:
                     TaskProgressColumn(),
                     TimeRemainingColumn(),
                     console=self._console,
+                    # update() only records state; the refresh thread draws,
+                    # so console writes stay at this rate however fast
+                    # files complete
+                    refresh_per_second=2,
                 )
                 self._progress.start()
                 self._task_id = self._progress.add_task(f"{event.phase}", total=event.files_count)
@@ -130,14 +134,16 @@ def _print_summary(
         flagged_files = [f for f in batch.files if f.flagged_pages]
         if flagged_files:
             console.print("[bold]Flagged Page Details:[/bold]")
+            # One print per file rather than per page: each call is a
+            # separate Rich render and console write
             for f in flagged_files:
-                console.print(f"  [cyan]{f.filename}[/cyan]:")
-                for p in f.pages:
-                    if p.flagged or p.engine == OCREngine.SURYA:
-                        console.print(
-                            f"    Page {p.page_number:>3}: "
-                            f"quality={p.quality_score:.1%}  engine={p.engine}"
-                        )
+                lines = [f"  [cyan]{f.filename}[/cyan]:"]
+                lines.extend(
+                    f"    Page {p.page_number:>3}: quality={p.quality_score:.1%}  engine={p.engine}"
+                    for p in f.pages
+                    if p.flagged or p.engine == OCREngine.SURYA
+                )
+                console.print("\n".join(lines))
             console.print()
 
 
@@ -193,6 +199,18 @@ Examples:
         action="store_true",
         help="Fail if GPU (MPS/CUDA) unavailable instead of falling back to CPU.",
     )
+    parser.add_argument(
+        "--surya-dtype",
+        choices=["fp32", "fp16", "bf16"],
+        default=None,
+        help="Surya model weight dtype (default: Surya's choice for the device)",
+    )
+    parser.add_argument(
+        "--surya-batch-pages",
+        type=int,
+        default=None,
+        help="Max pages per Surya call (default: sized from available memory)",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -258,6 +276,11 @@ Examples:
         help="Capture rich diagnostic data (image quality, engine diffs) "
         "and write .diagnostics.json sidecar",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results for unchanged PDFs from <output_dir>/.cache",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -371,6 +394,9 @@ Examples:
         timeout=args.timeout,
         extract_text=args.extract_text,
         diagnostics=args.diagnostics,
+        use_cache=args.cache,
+        surya_dtype=args.surya_dtype,
+        surya_pages_per_call=args.surya_batch_pages,
     )
 
     if args.json_output:
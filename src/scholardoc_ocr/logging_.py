@@ -14,41 +14,56 @@ Public API:
     setup_main_logging  — call once in main process before spawning workers
     worker_log_initializer — pass as initializer= to ProcessPoolExecutor
     stop_logging        — call in a finally block after workers finish
+
+Worker pools that outlive a single pipeline run share one queue between runs,
+possibly concurrent ones. For those, start_run_logging/stop_run_logging
+register each run's handlers with one long-lived listener, and workers call
+set_worker_run at the start of every task so their records are routed to
+that run.
+
+Workers only queue records at or above the main process level (INFO unless
+verbose), so ``pipeline.log`` and the console carry worker DEBUG records in
+verbose runs only. The per-worker ``worker_{pid}.log`` files keep DEBUG.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import multiprocessing as mp
 import os
+import threading
 from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
-__all__ = ["setup_main_logging", "worker_log_initializer", "stop_logging"]
+__all__ = [
+    "setup_main_logging",
+    "worker_log_initializer",
+    "stop_logging",
+    "start_run_logging",
+    "stop_run_logging",
+    "set_worker_run",
+]
 
 _LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 
+# LogRecord attributes: the run a worker record belongs to, and the marker on
+# the record stop_run_logging queues to drain a run's earlier records
+_RUN_ATTR = "scholardoc_run"
+_DRAIN_ATTR = "scholardoc_drain"
 
-def setup_main_logging(
-    log_dir: Path | None = None,
-    verbose: bool = False,
-) -> tuple[mp.Queue, QueueListener]:
-    """Set up main-process logging with a QueueListener.
-
-    Creates a multiprocessing.Queue and a QueueListener that dispatches to a
-    console StreamHandler (and optionally a RotatingFileHandler if *log_dir*
-    is provided).
+# Worker-side state, set by worker_log_initializer and set_worker_run
+_worker_run: str | None = None
+_worker_queue_handler: QueueHandler | None = None
+_worker_file_handler: logging.FileHandler | None = None
 
-    Args:
-        log_dir: If given, a ``pipeline.log`` file is written here.
-        verbose: If True, root logger level is DEBUG; otherwise INFO.
+# Main-side state: one listener and router per shared queue, keyed by id()
+_shared_listeners: dict[int, tuple[QueueListener, _RunRouter]] = {}
+_shared_lock = threading.Lock()
 
-    Returns:
-        (queue, listener) — pass *queue* to workers, call ``stop_logging(listener)``
-        when done.
-    """
-    log_queue: mp.Queue = mp.Queue()
 
+def _main_handlers(log_dir: Path | None) -> list[logging.Handler]:
+    """Console handler, plus a rotating ``pipeline.log`` in *log_dir* if given."""
     formatter = logging.Formatter(_LOG_FORMAT)
 
     # Console handler
@@ -68,7 +83,34 @@ def setup_main_logging(
         )
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
+    return handlers
+
 
+def setup_main_logging(
+    log_dir: Path | None = None,
+    verbose: bool = False,
+    log_queue: mp.Queue | None = None,
+) -> tuple[mp.Queue, QueueListener]:
+    """Set up main-process logging with a QueueListener.
+
+    Creates a multiprocessing.Queue and a QueueListener that dispatches to a
+    console StreamHandler (and optionally a RotatingFileHandler if *log_dir*
+    is provided).
+
+    Args:
+        log_dir: If given, a ``pipeline.log`` file is written here.
+        verbose: If True, root logger level is DEBUG; otherwise INFO.
+        log_queue: Existing queue to listen on, e.g. one that long-lived
+            worker processes already hold. A new queue is created if omitted.
+
+    Returns:
+        (queue, listener) — pass *queue* to workers, call ``stop_logging(listener)``
+        when done.
+    """
+    if log_queue is None:
+        log_queue = mp.Queue()
+
+    handlers = _main_handlers(log_dir)
     listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
     listener.start()
 
@@ -82,6 +124,7 @@ def setup_main_logging(
 def worker_log_initializer(
     log_queue: mp.Queue,
     log_dir: Path | None = None,
+    level: int = logging.DEBUG,
 ) -> None:
     """Initializer for ProcessPoolExecutor workers.
 
@@ -91,23 +134,68 @@ def worker_log_initializer(
     Args:
         log_queue: The queue returned by :func:`setup_main_logging`.
         log_dir: If given, a ``worker_{pid}.log`` file is written here.
+        level: Lowest level sent through the queue. Pass the main process
+            level so records it would discard are never pickled and queued.
     """
+    global _worker_queue_handler, _worker_file_handler
     root = logging.getLogger()
     # Clear any inherited handlers
     root.handlers.clear()
-    root.setLevel(logging.DEBUG)
+    _worker_file_handler = None
 
-    # QueueHandler sends records to main process
-    root.addHandler(QueueHandler(log_queue))
+    # QueueHandler sends records to main process, tagged with the current run
+    _worker_queue_handler = QueueHandler(log_queue)
+    _worker_queue_handler.addFilter(_stamp_run)
+    root.addHandler(_worker_queue_handler)
+
+    set_worker_run(None, log_dir, level)
+
+
+def _stamp_run(record: logging.LogRecord) -> bool:
+    """Filter that tags a worker record with the run it was logged for."""
+    setattr(record, _RUN_ATTR, _worker_run)
+    return True
+
+
+def set_worker_run(
+    run_id: str | None,
+    log_dir: Path | None = None,
+    level: int = logging.DEBUG,
+) -> None:
+    """Point this worker's logging at one pipeline run.
+
+    Workers in a persistent pool outlive any single run, so each task calls
+    this with its run's settings before logging anything. Only the values
+    that changed since the last task are applied.
+
+    Args:
+        run_id: Run id passed to :func:`start_run_logging` by the main process.
+        log_dir: If given, a ``worker_{pid}.log`` file is written here.
+        level: Lowest level sent through the queue.
+    """
+    global _worker_run, _worker_file_handler
+    _worker_run = run_id
+    root = logging.getLogger()
+    # The per-worker file still gets DEBUG; without it nothing below *level* is used
+    root.setLevel(logging.DEBUG if log_dir is not None else level)
+    if _worker_queue_handler is not None:
+        _worker_queue_handler.setLevel(level)
 
     # Optional per-worker file
-    if log_dir is not None:
-        log_dir = Path(log_dir)
-        log_dir.mkdir(parents=True, exist_ok=True)
-        formatter = logging.Formatter(_LOG_FORMAT)
-        fh = logging.FileHandler(log_dir / f"worker_{os.getpid()}.log")
-        fh.setFormatter(formatter)
+    log_file = Path(log_dir) / f"worker_{os.getpid()}.log" if log_dir is not None else None
+    current = Path(_worker_file_handler.baseFilename) if _worker_file_handler else None
+    if log_file == current:
+        return
+    if _worker_file_handler is not None:
+        root.removeHandler(_worker_file_handler)
+        _worker_file_handler.close()
+        _worker_file_handler = None
+    if log_file is not None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        fh = logging.FileHandler(log_file)
+        fh.setFormatter(logging.Formatter(_LOG_FORMAT))
         root.addHandler(fh)
+        _worker_file_handler = fh
 
 
 def stop_logging(listener: QueueListener) -> None:
@@ -119,3 +207,101 @@ def stop_logging(listener: QueueListener) -> None:
         listener.stop()
     except Exception:  # noqa: BLE001
         pass
+
+
+class _RunRouter(logging.Handler):
+    """Dispatch records from a shared queue to the handlers of their run."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._runs: dict[str, list[logging.Handler]] = {}
+        self._drained: dict[str, threading.Event] = {}
+
+    def add_run(self, run_id: str, handlers: list[logging.Handler]) -> None:
+        self._runs[run_id] = handlers
+
+    def remove_run(self, run_id: str) -> list[logging.Handler]:
+        return self._runs.pop(run_id, [])
+
+    def expect_drain(self, run_id: str) -> threading.Event:
+        event = threading.Event()
+        self._drained[run_id] = event
+        return event
+
+    def emit(self, record: logging.LogRecord) -> None:
+        run_id = getattr(record, _RUN_ATTR, None)
+        if getattr(record, _DRAIN_ATTR, False):
+            event = self._drained.pop(run_id, None)
+            if event is not None:
+                event.set()
+            return
+        # Records stamped with no run (worker start-up) have nowhere to go
+        for handler in self._runs.get(run_id, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def start_run_logging(
+    log_queue: mp.Queue,
+    run_id: str,
+    log_dir: Path | None = None,
+    verbose: bool = False,
+) -> None:
+    """Route worker records for *run_id* from a shared queue to its own handlers.
+
+    The first call for *log_queue* starts one QueueListener on it, which then
+    lives as long as the process. Runs never stop it: ``QueueListener.stop()``
+    queues a sentinel that a listener belonging to another run could take.
+
+    Args:
+        log_queue: Queue the persistent workers were started with.
+        run_id: Id the run's tasks pass to :func:`set_worker_run`.
+        log_dir: If given, the run's ``pipeline.log`` file is written here.
+        verbose: If True, root logger level is DEBUG; otherwise INFO.
+    """
+    with _shared_lock:
+        entry = _shared_listeners.get(id(log_queue))
+        if entry is None:
+            router = _RunRouter()
+            listener = QueueListener(log_queue, router)
+            listener.start()
+            _shared_listeners[id(log_queue)] = (listener, router)
+        else:
+            router = entry[1]
+    router.add_run(run_id, _main_handlers(log_dir))
+
+    # Configure root logger level
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+
+def stop_run_logging(log_queue: mp.Queue, run_id: str, timeout: float = 5.0) -> None:
+    """Flush *run_id*'s queued records, then close its handlers.
+
+    A marker record is queued behind the run's records, and the handlers are
+    removed once the listener reaches it (or after *timeout* seconds). The
+    listener itself keeps running for other runs.
+    """
+    entry = _shared_listeners.get(id(log_queue))
+    if entry is None:
+        return
+    router = entry[1]
+    drained = router.expect_drain(run_id)
+    marker = logging.makeLogRecord({_RUN_ATTR: run_id, _DRAIN_ATTR: True})
+    try:
+        log_queue.put(marker)
+        drained.wait(timeout)
+    except Exception:  # noqa: BLE001
+        pass
+    for handler in router.remove_run(run_id):
+        handler.close()
+
+
+@atexit.register
+def _stop_shared_listeners() -> None:
+    """Stop the shared listeners before multiprocessing closes their queues."""
+    with _shared_lock:
+        entries = list(_shared_listeners.values())
+        _shared_listeners.clear()
+    for listener, _ in entries:
+        stop_logging(listener)
@@ -212,6 +212,7 @@ async def ocr_async(
         force_surya=force_surya,
         max_workers=max_workers,
         extract_text=extract_text,
+        reuse_pool=True,
     )
     if files:
         config.files = files
@@ -362,6 +363,7 @@ async def ocr(
             force_surya=force_surya,
             max_workers=max_workers,
             extract_text=extract_text,
+            reuse_pool=True,
         )
         if target_file is not None:
             config.files = [target_file.name]
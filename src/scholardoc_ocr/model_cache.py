@@ -91,7 +91,9 @@ class ModelCache:
                     cls._instance = cls(ttl_seconds)
         return cls._instance
 
-    def get_models(self, device: str | None = None) -> tuple[dict[str, Any], str]:
+    def get_models(
+        self, device: str | None = None, dtype: str | None = None
+    ) -> tuple[dict[str, Any], str]:
         """Get cached models or load fresh if cache miss or expired.
 
         Thread-safe: model loading happens outside the lock to avoid blocking
@@ -101,11 +103,13 @@ class ModelCache:
         Args:
             device: Optional device string (e.g. "cpu", "cuda", "mps").
                 If None, auto-detects the best available device.
+            dtype: Optional weight dtype ("fp32", "fp16", "bf16"). Models loaded
+                with a different dtype are replaced (the cache holds one set).
 
         Returns:
             Tuple of (model_dict, device_used_str).
         """
-        cache_key = "models"
+        cache_key = "models" if dtype is None else f"models:{dtype}"
 
         # Fast path: check cache under lock
         with self._cache_lock:
@@ -118,7 +122,10 @@ class ModelCache:
         logger.info("Cache miss, loading models (device=%s)", device)
         from . import surya  # noqa: PLC0415
 
-        model_dict, device_used = surya.load_models(device)
+        if dtype is None:
+            model_dict, device_used = surya.load_models(device)
+        else:
+            model_dict, device_used = surya.load_models(device, dtype=dtype)
         load_time = time.time()
 
         # Store in cache under lock
@@ -142,7 +149,7 @@ class ModelCache:
             True if models are cached and not expired.
         """
         with self._cache_lock:
-            return "models" in self._cache
+            return len(self._cache) > 0
 
     def evict(self) -> None:
         """Force eviction of cached models and cleanup GPU memory.
@@ -150,8 +157,8 @@ class ModelCache:
         Call this to free GPU memory when models are no longer needed.
         """
         with self._cache_lock:
-            if "models" in self._cache:
-                del self._cache["models"]
+            if len(self._cache) > 0:
+                self._cache.clear()
                 self._load_time = None
                 logger.info("Models evicted from cache")
 
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
 import logging
 import os
 import shutil
+import sys
+import threading
 import time
 import traceback
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
 from .callbacks import (
     LoggingCallback,
@@ -29,8 +35,18 @@ from .types import (
     compute_engine_from_pages,
 )
 
+if TYPE_CHECKING:
+    from .processor import PDFProcessor
+    from .quality import QualityAnalyzer
+
 logger = logging.getLogger(__name__)
 
+# Per-process state, populated by _tesseract_worker_init and reused by every
+# _tesseract_worker call that lands in the same process. The main process
+# uses the same helpers for planning and Phase 2 re-scoring.
+_WORKER_PROCESSOR: PDFProcessor | None = None
+_WORKER_ANALYZERS: dict[tuple[float, int], QualityAnalyzer] = {}
+
 
 @dataclass
 class PipelineConfig:
@@ -52,6 +68,338 @@ class PipelineConfig:
     timeout: int = 1800
     extract_text: bool = False
     diagnostics: bool = False
+    use_cache: bool = False
+    surya_dtype: str | None = None  # "fp32", "fp16", "bf16"; None = Surya's device default
+    surya_pages_per_call: int | None = None  # Cap on pages per Surya call (sub-batch)
+    reuse_pool: bool = False  # Keep Tesseract workers alive for the next run_pipeline call
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write *text* via a temp file and rename, so *path* is never left truncated.
+
+    Reruns often produce identical output, so the write is skipped when *path*
+    already holds exactly *text*.
+    """
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            if f.read() == text:
+                return
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# ioctl request from linux/fs.h: share src's extents with dest (btrfs, XFS)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: Path, dest: Path) -> bool:
+    """Copy-on-write clone *src* to a new *dest*; False where unsupported.
+
+    A clone shares the data blocks instead of copying them (APFS clonefile,
+    FICLONE on btrfs/XFS), so output PDFs of any size cost no disk I/O.
+    """
+    dest.unlink(missing_ok=True)
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.clonefile(os.fsencode(src), os.fsencode(dest), 0) == 0
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                return False
+        return True
+    return False
+
+
+def _copy_atomic(src: Path, dest: Path) -> None:
+    """Copy *src* to *dest* via a temp file and rename.
+
+    The copy keeps *src*'s mtime, so a *dest* with the same size and mtime is
+    taken to be an earlier copy and left alone.
+    """
+    src_stat = src.stat()
+    try:
+        dest_stat = dest.stat()
+        if (dest_stat.st_size, dest_stat.st_mtime_ns) == (
+            src_stat.st_size,
+            src_stat.st_mtime_ns,
+        ):
+            return
+    except OSError:
+        pass
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    if _clone_file(src, tmp):
+        shutil.copystat(src, tmp)
+    else:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dest)
+
+
+def _format_error(exc: BaseException) -> str:
+    """FileResult error text; the traceback is appended only when DEBUG is on.
+
+    Callers already log the exception with ``exc_info=True``, so the handler
+    formats the traceback lazily for the log either way.
+    """
+    message = f"{type(exc).__name__}: {exc}"
+    if logger.isEnabledFor(logging.DEBUG):
+        return f"{message}\n{traceback.format_exc()}"
+    return message
+
+
+def _unlink(path: Path) -> None:
+    """Delete a file, ignoring a missing one."""
+    path.unlink(missing_ok=True)
+
+
+def _remove_all(paths: Iterable[Path]) -> None:
+    """Delete many files concurrently.
+
+    Unlink is syscall-bound and releases the GIL, so a thread fan-out
+    shortens cleanup of large batches without changing what gets removed.
+    """
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(_unlink, paths))
+
+
+def _prefetch(paths: Iterable[Path]) -> None:
+    """Ask the kernel to read files into the page cache ahead of use.
+
+    No-op where ``posix_fadvise`` is unavailable (macOS, Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# Pages with less extracted text than this that draw an image are treated
+# as scans without a text layer
+_IMAGE_ONLY_MAX_CHARS = 30
+
+
+def _get_worker_processor() -> PDFProcessor:
+    """Return this process's shared PDFProcessor, creating it on first use."""
+    global _WORKER_PROCESSOR
+    if _WORKER_PROCESSOR is None:
+        from .processor import PDFProcessor
+
+        _WORKER_PROCESSOR = PDFProcessor()
+    return _WORKER_PROCESSOR
+
+
+def _get_worker_analyzer(threshold: float, max_samples: int) -> QualityAnalyzer:
+    """Return this process's QualityAnalyzer for the given settings.
+
+    Construction loads the dictionary word list, so analyzers are kept per
+    process rather than rebuilt for every file.
+    """
+    key = (threshold, max_samples)
+    analyzer = _WORKER_ANALYZERS.get(key)
+    if analyzer is None:
+        from .quality import QualityAnalyzer
+
+        analyzer = QualityAnalyzer(threshold, max_samples=max_samples)
+        _WORKER_ANALYZERS[key] = analyzer
+    return analyzer
+
+
+def _tesseract_worker_init(
+    log_queue, log_dir: Path | None = None, log_level: int = logging.DEBUG
+) -> None:
+    """ProcessPoolExecutor initializer for Tesseract workers.
+
+    Sets up queue logging, then pays the module import and PDFProcessor
+    setup cost once per worker process instead of once per file.
+    """
+    from .logging_ import worker_log_initializer
+
+    worker_log_initializer(log_queue, log_dir, log_level)
+
+    from . import diagnostics, postprocess, tesseract  # noqa: F401
+
+    _ = _get_worker_processor().fitz  # force the PyMuPDF import
+
+
+# Tesseract pool kept alive between run_pipeline calls when reuse_pool is set,
+# so long-lived callers (the MCP server) pay worker start-up and the
+# initializer's imports once per process rather than once per request.
+# The pool is sized once from the configured max_workers, not from each run's
+# file count, so small and large requests share it. Runs may overlap, so
+# _POOL_USERS counts the runs holding the pool and it is only replaced once
+# none do. Log settings travel with each task instead.
+_POOL: ProcessPoolExecutor | None = None
+_POOL_MAX_WORKERS = 0  # config.max_workers the pool was sized for
+_POOL_WORKERS = 0
+_POOL_USERS = 0
+_POOL_LOG_QUEUE = None
+_POOL_LOCK = threading.Lock()
+
+
+# Imported once in the forkserver, so each forked worker starts with them loaded
+_FORKSERVER_PRELOAD = [
+    "scholardoc_ocr.pipeline",
+    "scholardoc_ocr.diagnostics",
+    "scholardoc_ocr.postprocess",
+    "scholardoc_ocr.processor",
+    "scholardoc_ocr.quality",
+    "scholardoc_ocr.tesseract",
+    "fitz",
+    "ocrmypdf",
+]
+
+
+def _pool_context():
+    """Multiprocessing context for Tesseract pools.
+
+    Linux uses forkserver: forking the main process directly is unsafe once
+    it has threads (the Surya warmup thread, torch, the MCP event loop), and
+    the server imports the worker modules once for every child it forks.
+    macOS and Windows keep their default, spawn.
+    """
+    import multiprocessing as mp
+
+    if not sys.platform.startswith("linux"):
+        return mp.get_context()
+    ctx = mp.get_context("forkserver")
+    ctx.set_forkserver_preload(_FORKSERVER_PRELOAD)
+    return ctx
+
+
+def _shared_log_queue():
+    """Return the log queue the persistent pool's workers were started with."""
+    global _POOL_LOG_QUEUE
+    with _POOL_LOCK:
+        if _POOL_LOG_QUEUE is None:
+            _POOL_LOG_QUEUE = _pool_context().Queue()
+        return _POOL_LOG_QUEUE
+
+
+def _acquire_pool(max_workers: int, pool_size: int, needed: int) -> ProcessPoolExecutor | None:
+    """Hold the persistent Tesseract pool for one run, starting it if needed.
+
+    The pool is keyed on the configured *max_workers* and started with
+    *pool_size* workers (that maximum after the core and memory caps). A run
+    takes it as long as it has at least the *needed* workers; runs with fewer
+    files simply leave some workers idle. It is rebuilt only when the
+    configured maximum changes, or when it is too small for *needed*.
+
+    A pool that another run still holds is never replaced: in that case None
+    is returned and the caller uses a pool of its own. A pool left broken by
+    a crashed worker is replaced, since nothing more can be submitted to it
+    anyway.
+
+    Every successful call must be paired with :func:`_release_pool`.
+    """
+    global _POOL, _POOL_MAX_WORKERS, _POOL_WORKERS, _POOL_USERS
+    log_queue = _shared_log_queue()
+    with _POOL_LOCK:
+        if _POOL is not None and getattr(_POOL, "_broken", False):
+            _POOL.shutdown(wait=False)
+            _POOL, _POOL_USERS = None, 0
+        if _POOL is not None and _POOL_MAX_WORKERS == max_workers and _POOL_WORKERS >= needed:
+            _POOL_USERS += 1
+            return _POOL
+        if _POOL is not None and _POOL_USERS:
+            return None
+        old, _POOL = _POOL, None
+        if old is not None:
+            # Idle, so this does not wait on anyone's work
+            old.shutdown(wait=True)
+        pool_size = max(pool_size, needed)
+        _POOL = ProcessPoolExecutor(
+            max_workers=pool_size,
+            mp_context=_pool_context(),
+            initializer=_tesseract_worker_init,
+            initargs=(log_queue, None, logging.DEBUG),
+        )
+        _POOL_MAX_WORKERS, _POOL_WORKERS, _POOL_USERS = max_workers, pool_size, 1
+        return _POOL
+
+
+def _release_pool(pool: ProcessPoolExecutor, cancel: bool = False) -> None:
+    """Give back a pool taken with :func:`_acquire_pool`.
+
+    With *cancel* (the run was interrupted) the pool is shut down if no other
+    run holds it, so queued work does not leak into the next call.
+    """
+    global _POOL, _POOL_USERS
+    with _POOL_LOCK:
+        if pool is not _POOL:
+            return
+        _POOL_USERS = max(_POOL_USERS - 1, 0)
+        if not cancel or _POOL_USERS:
+            return
+        _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool(cancel_futures: bool = False) -> None:
+    """Shut down the persistent Tesseract pool, if one is running.
+
+    Registered with :mod:`atexit`; safe to call more than once.
+    """
+    global _POOL, _POOL_MAX_WORKERS, _POOL_WORKERS, _POOL_USERS
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+        _POOL_MAX_WORKERS, _POOL_WORKERS, _POOL_USERS = 0, 0, 0
+    if pool is not None:
+        pool.shutdown(wait=not cancel_futures, cancel_futures=cancel_futures)
+
+
+atexit.register(shutdown_pool)
+
+
+@contextlib.contextmanager
+def _tesseract_pool(
+    max_workers: int,
+    log_queue,
+    log_dir: Path | None,
+    log_level: int,
+    reuse: tuple[int, int] | None = None,
+):
+    """Yield an executor for Phase 1: a fresh pool, or the persistent one if *reuse*.
+
+    *reuse* is (configured max_workers, persistent pool size); see
+    :func:`_acquire_pool`. A fresh pool is shut down on exit as before. The
+    persistent pool stays up unless the run is interrupted and no other run
+    holds it. If the persistent pool is busy and cannot serve this run, the
+    run gets a fresh pool instead.
+    """
+    executor = _acquire_pool(*reuse, max_workers) if reuse is not None else None
+    if executor is None:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_pool_context(),
+            initializer=_tesseract_worker_init,
+            initargs=(log_queue, log_dir, log_level),
+        ) as executor:
+            yield executor
+        return
+
+    try:
+        yield executor
+    except BaseException:
+        _release_pool(executor, cancel=True)
+        raise
+    _release_pool(executor)
 
 
 def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) -> FileResult:
@@ -62,10 +410,13 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
     """
     from .diagnostics import build_always_diagnostics
     from .postprocess import postprocess
-    from .processor import PDFProcessor
-    from .quality import QualityAnalyzer
     from .tesseract import TesseractConfig, run_ocr
 
+    if "log_run" in config_dict:
+        from .logging_ import set_worker_run
+
+        set_worker_run(config_dict["log_run"], config_dict["log_dir"], config_dict["log_level"])
+
     start = time.time()
     timings: dict[str, float] = {}
 
@@ -73,40 +424,95 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
     force_tesseract = config_dict.get("force_tesseract", False)
     jobs_per_file = config_dict.get("jobs_per_file", 1)
 
-    processor = PDFProcessor()
-    analyzer = QualityAnalyzer(threshold, max_samples=config_dict.get("max_samples", 20))
+    processor = _get_worker_processor()
+    analyzer = _get_worker_analyzer(threshold, config_dict.get("max_samples", 20))
 
+    # Only kept intermediates go in work/; skip creating (and later sweeping)
+    # an empty directory per file otherwise
     work_dir = output_dir / "work" / input_path.stem
-    work_dir.mkdir(parents=True, exist_ok=True)
     final_dir = output_dir / "final"
     final_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Extract existing text page-by-page
-        t0 = time.time()
-        page_texts = processor.extract_text_by_page(input_path)
-        timings["extract_text"] = time.time() - t0
-        page_count = len(page_texts) or processor.get_page_count(input_path)
-
-        # Analyze quality
-        t0 = time.time()
-        page_results = analyzer.analyze_pages(page_texts)
-        timings["analyze_quality"] = time.time() - t0
+        unreadable = mostly_scanned = False
+        image_only_pages: set[int] = set()
+        if force_tesseract:
+            # Existing text would be discarded; only the page count is needed
+            page_texts: list[str] = []
+            page_results: list = []
+            page_count = config_dict.get("page_count") or processor.get_page_count(input_path)
+        else:
+            # Extract and score existing text one page at a time. One flagged
+            # page sends the whole file to Tesseract, which re-extracts and
+            # re-scores it anyway, so the remaining pages are not read
+            page_texts = []
+            page_results = []
+            extract_s = analyze_s = 0.0
+            stopped_early = False
+            with contextlib.closing(
+                processor.iter_text_by_page(input_path, _IMAGE_ONLY_MAX_CHARS)
+            ) as texts:
+                while True:
+                    t0 = time.time()
+                    try:
+                        page = next(texts, None)
+                    except Exception:
+                        # The pages read so far cannot stand in for the file
+                        logger.warning(
+                            "%s: existing text unreadable, running Tesseract",
+                            input_path.name,
+                            exc_info=True,
+                        )
+                        stopped_early = unreadable = True
+                        break
+                    t1 = time.time()
+                    extract_s += t1 - t0
+                    if page is None:
+                        break
+                    text, image_only = page
+                    if image_only:
+                        image_only_pages.add(len(page_texts))
+                    page_result = analyzer.analyze(text)
+                    analyze_s += time.time() - t1
+                    page_texts.append(text)
+                    page_results.append(page_result)
+                    if page_result.flagged:
+                        stopped_early = True
+                        break
+            timings["extract_text"] = extract_s
+            timings["analyze_quality"] = analyze_s
+            # Scoring rates empty text as neutral, so a scan without a text
+            # layer would pass through unOCRed. A few image-only pages (a
+            # cover, plates) are flagged for Surya while the rest of the text
+            # layer is kept; a majority means the whole file is a scan
+            if not stopped_early and len(image_only_pages) * 2 > len(page_texts):
+                mostly_scanned = True
+            if page_texts and not stopped_early:
+                page_count = len(page_texts)
+            else:
+                page_count = config_dict.get("page_count") or processor.get_page_count(
+                    input_path
+                )
 
         page_qualities = [r.score for r in page_results]
         overall_quality = sum(page_qualities) / len(page_qualities) if page_qualities else 0.0
-        bad_pages = [i for i, r in enumerate(page_results) if r.flagged]
-
-        # If existing text is good enough and not forced, use as-is
-        if not force_tesseract and not bad_pages:
+        bad_pages = image_only_pages | {i for i, r in enumerate(page_results) if r.flagged}
+
+        # If existing text is good enough and not forced, use as-is. Image-only
+        # pages alone do not need Tesseract; Phase 2 OCRs them page by page
+        if (
+            not force_tesseract
+            and bad_pages <= image_only_pages
+            and not (unreadable or mostly_scanned)
+        ):
             pp_counts: dict[str, int] = {}
             full_text = postprocess(
                 "\n\n".join(page_texts), counts=pp_counts
             )
             text_path = final_dir / f"{input_path.stem}.txt"
-            text_path.write_text(full_text, encoding="utf-8")
+            _write_text_atomic(text_path, full_text)
             pdf_path = final_dir / f"{input_path.stem}.pdf"
-            shutil.copy(input_path, pdf_path)
+            _copy_atomic(input_path, pdf_path)
 
             # Build diagnostics for each page (DIAG-02/03/05/06/07)
             page_diagnostics = []
@@ -139,12 +545,12 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
             pages = [
                 PageResult(
                     page_number=i,
-                    status=PageStatus.GOOD,
+                    status=PageStatus.FLAGGED if i in image_only_pages else PageStatus.GOOD,
                     quality_score=(
                         page_qualities[i] if i < len(page_qualities) else 0.0
                     ),
                     engine=OCREngine.EXISTING,
-                    flagged=False,
+                    flagged=i in image_only_pages,
                     text=page_texts[i] if i < len(page_texts) else None,
                     diagnostics=(
                         page_diagnostics[i]
@@ -165,17 +571,27 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
                 output_path=str(pdf_path),
             )
 
-        # Run Tesseract
+        # Run Tesseract. Unless the intermediate is kept for inspection,
+        # ocrmypdf writes beside the final PDF and the result is renamed into
+        # place, so an interrupted run never leaves a truncated final PDF
         t0 = time.time()
-        tess_output = work_dir / f"{input_path.stem}_tesseract.pdf"
+        pdf_path = final_dir / f"{input_path.stem}.pdf"
+        keep_intermediates = config_dict.get("keep_intermediates", False)
+        if keep_intermediates:
+            work_dir.mkdir(parents=True, exist_ok=True)
+            tess_output = work_dir / f"{input_path.stem}_tesseract.pdf"
+        else:
+            tess_output = final_dir / f".{pdf_path.name}.tmp"
         tess_config = TesseractConfig(
-            langs=config_dict.get("langs_tesseract", ["eng", "fra", "ell", "lat"]),
+            langs=config_dict["langs_tesseract"],
             jobs=jobs_per_file,
         )
         tess_result = run_ocr(input_path, tess_output, tess_config)
         timings["tesseract"] = time.time() - t0
 
         if not tess_result.success:
+            if not keep_intermediates:
+                tess_output.unlink(missing_ok=True)
             return FileResult(
                 filename=input_path.name,
                 success=False,
@@ -187,6 +603,9 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
                 time_seconds=time.time() - start,
                 phase_timings=timings,
             )
+        if not keep_intermediates:
+            os.replace(tess_output, pdf_path)
+            tess_output = pdf_path
 
         # Re-extract and re-analyze after Tesseract
         t0 = time.time()
@@ -199,7 +618,7 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
 
         tess_qualities = [r.score for r in tess_page_results]
         tess_overall = sum(tess_qualities) / len(tess_qualities) if tess_qualities else 0.0
-        bad_after_tess = [i for i, r in enumerate(tess_page_results) if r.flagged]
+        bad_after_tess = {i for i, r in enumerate(tess_page_results) if r.flagged}
 
         # Write Tesseract output
         tess_pp_counts: dict[str, int] = {}
@@ -207,9 +626,9 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
             "\n\n".join(tess_page_texts), counts=tess_pp_counts
         )
         text_path = final_dir / f"{input_path.stem}.txt"
-        text_path.write_text(full_text, encoding="utf-8")
-        pdf_path = final_dir / f"{input_path.stem}.pdf"
-        shutil.copy(tess_output, pdf_path)
+        _write_text_atomic(text_path, full_text)
+        if tess_output != pdf_path:
+            _copy_atomic(tess_output, pdf_path)
 
         # Build diagnostics for each page (DIAG-02/03/05/06/07)
         tess_diagnostics = []
@@ -290,12 +709,170 @@ def _tesseract_worker(input_path: Path, output_dir: Path, config_dict: dict) ->
             quality_score=0.0,
             page_count=0,
             pages=[],
-            error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}",
+            error=_format_error(e),
             time_seconds=time.time() - start,
             phase_timings=timings,
         )
 
 
+# Settings that change pipeline output; part of the result cache key
+_CACHE_KEY_SETTINGS = (
+    "langs_tesseract",
+    "langs_surya",
+    "quality_threshold",
+    "force_tesseract",
+    "max_samples",
+    "diagnostics",
+)
+
+
+# Rough peak RSS of one Tesseract pool worker (ocrmypdf + rasterized pages)
+_WORKER_MEMORY_MB = 500
+
+_CGROUP_DIR = Path("/sys/fs/cgroup")
+
+
+def _usable_cpu_count() -> int:
+    """CPUs this process may run on (affinity mask), falling back to cpu_count()."""
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    return os.cpu_count() or 4
+
+
+def _available_memory_mb() -> int:
+    """Available RAM in MiB, clamped to the cgroup v2 limit when one is set."""
+    import psutil
+
+    available = psutil.virtual_memory().available
+    try:
+        limit = (_CGROUP_DIR / "memory.max").read_text().strip()
+        if limit != "max":
+            current = int((_CGROUP_DIR / "memory.current").read_text())
+            available = min(available, int(limit) - current)
+    except (OSError, ValueError):
+        pass
+    return max(0, available) // (1024 * 1024)
+
+
+def _plan_workers(
+    total_cores: int, num_files: int, max_workers: int, available_mb: int
+) -> tuple[int, int]:
+    """Return (ocrmypdf jobs per file, pool workers) for a run.
+
+    Cores are shared among the files that can run at once, which is at most
+    *max_workers*, not among all queued files: with 20 files on 8 cores and
+    4 workers each ocrmypdf gets 2 jobs instead of 1, keeping every core busy.
+    """
+    concurrent_files = max(1, min(num_files, max_workers))
+    jobs_per_file = max(1, total_cores // concurrent_files)
+    pool_workers = max(
+        1,
+        min(
+            max_workers,
+            total_cores // jobs_per_file,
+            available_mb // _WORKER_MEMORY_MB,
+        ),
+    )
+    # The memory cap can leave fewer workers than files; give them the cores
+    jobs_per_file = max(1, total_cores // min(concurrent_files, pool_workers))
+    return jobs_per_file, pool_workers
+
+
+def _jobs_by_page_count(page_counts: list[int], total_cores: int) -> list[int]:
+    """Split cores across concurrently running files in proportion to page count.
+
+    ocrmypdf parallelizes pages within a file via ``jobs``, so giving a 600-page
+    book most of the cores keeps them busy after its small siblings finish.
+    Falls back to an even split when page counts are unknown.
+
+    Every file gets one job and the spare cores are shared out by largest
+    remainder, so the total never exceeds *total_cores* (unless there are
+    more files than cores).
+    """
+    spare = total_cores - len(page_counts)
+    total_pages = sum(page_counts)
+    if spare <= 0:
+        return [1] * len(page_counts)
+    if total_pages <= 0:
+        return [total_cores // len(page_counts)] * len(page_counts)
+    shares = [divmod(spare * n, total_pages) for n in page_counts]
+    jobs = [1 + q for q, _ in shares]
+    leftover = total_cores - sum(jobs)
+    by_remainder = sorted(range(len(shares)), key=lambda i: shares[i][1], reverse=True)
+    for i in by_remainder[:leftover]:
+        jobs[i] += 1
+    return jobs
+
+
+def _restore_from_cache(result_cache, key: str, path: Path, final_dir: Path) -> FileResult | None:
+    """Serve a FileResult and its artifacts from the result cache, if present."""
+    t0 = time.time()
+    result = result_cache.get(key)
+    if result is None:
+        return None
+    restored = result_cache.restore(key, final_dir, path.stem)
+    if ".pdf" not in restored:
+        return None
+    # The key is content-only, so a renamed or duplicated PDF hits another name's entry
+    result.filename = path.name
+    result.output_path = str(restored[".pdf"])
+    result.time_seconds = time.time() - t0
+    result.phase_timings = {"cache_lookup": result.time_seconds}
+    return result
+
+
+def _store_in_cache(result_cache, key: str, result: FileResult, final_dir: Path) -> None:
+    """Store *result* and its final ``.pdf``/``.txt`` under *key*."""
+    stem = Path(result.output_path).stem
+    result_cache.put(key, result, [final_dir / f"{stem}.pdf", final_dir / f"{stem}.txt"])
+
+
+def _preimport_torch() -> None:
+    """Import torch ahead of Phase 2; a no-op where it is not installed.
+
+    torch is the largest import on the Surya path and, unlike marker and
+    Surya, does not read the batch-size environment variables, so it can be
+    loaded while Phase 1 is still running.
+    """
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _load_surya_models(dtype: str | None = None) -> tuple[dict, str, float]:
+    """Configure Surya batch sizes and load models via the shared cache.
+
+    Called once Phase 1 has finished, so the memory reading that sizes the
+    batches does not count the Tesseract workers.
+
+    Args:
+        dtype: Optional weight dtype passed through to ModelCache.get_models().
+
+    Returns:
+        Tuple of (model_dict, device_used, load_seconds).
+    """
+    from .batch import configure_surya_batch_sizes, get_available_memory_gb
+    from .model_cache import ModelCache
+
+    # Configure batch sizes BEFORE model loading (BATCH-02, BATCH-03)
+    # This must happen before any marker/Surya imports
+    available_mem = get_available_memory_gb()
+    batch_config = configure_surya_batch_sizes("mps", available_mem)
+    logger.info("Surya batch config: %s (memory: %.1fGB)", batch_config, available_mem)
+
+    # Load models once (via cache for MODEL-01)
+    cache = ModelCache.get_instance()
+    t0 = time.time()
+    model_dict, device_used = cache.get_models(dtype=dtype)
+    if logger.isEnabledFor(logging.INFO):
+        mps_sync()  # Instrumentation only: make the reported load time include GPU work
+    return model_dict, device_used, time.time() - t0
+
+
 def run_pipeline(
     config: PipelineConfig,
     callback: PipelineCallback | None = None,
@@ -308,9 +885,7 @@ def run_pipeline(
     Returns:
         BatchResult with per-file and per-page details.
     """
-    from . import surya
-    from .logging_ import setup_main_logging, stop_logging, worker_log_initializer
-    from .model_cache import ModelCache, cleanup_between_documents
+    from .logging_ import setup_main_logging, start_run_logging, stop_logging, stop_run_logging
     from .postprocess import postprocess as _postprocess
 
     cb: PipelineCallback = callback or LoggingCallback()
@@ -323,7 +898,26 @@ def run_pipeline(
     # Set up queue-based logging for worker processes
     log_dir = config.output_dir / "logs"
     log_dir.mkdir(parents=True, exist_ok=True)
-    log_queue, log_listener = setup_main_logging(log_dir=log_dir, verbose=config.debug)
+    log_run: str | None = None
+    log_listener = None
+    if config.reuse_pool:
+        # The persistent pool's workers outlive this run, so their records are
+        # tagged with a run id and routed by the queue's long-lived listener
+        log_run = uuid.uuid4().hex
+        log_queue = _shared_log_queue()
+        start_run_logging(log_queue, log_run, log_dir=log_dir, verbose=config.debug)
+    else:
+        log_queue, log_listener = setup_main_logging(
+            log_dir=log_dir,
+            verbose=config.debug,
+            # Created from the pool's context; workers cannot share a fork-context queue
+            log_queue=_pool_context().Queue(),
+        )
+
+    # Background torch import, started on the first flagged Phase 1 result
+    warmup_pool: ThreadPoolExecutor | None = None
+    # Builds the next Surya sub-batch's combined PDF while the current one runs
+    combine_pool: ThreadPoolExecutor | None = None
 
     try:
         # --- File discovery ---
@@ -343,18 +937,44 @@ def run_pipeline(
             return BatchResult(files=[], total_time_seconds=0.0)
 
         # --- Resource-aware worker calculation ---
-        total_cores = os.cpu_count() or 4
+        total_cores = _usable_cpu_count()
+        available_mb = _available_memory_mb()
         num_files = len(input_files)
-        jobs_per_file = max(1, total_cores // max(1, num_files))
-        pool_workers = max(1, min(config.max_workers, total_cores // jobs_per_file))
+        jobs_per_file, pool_workers = _plan_workers(
+            total_cores, num_files, config.max_workers, available_mb
+        )
+        persistent_pool = None
+        if config.reuse_pool:
+            # Size the shared pool for a full run, whatever this run's file count
+            _, full_workers = _plan_workers(
+                total_cores, config.max_workers, config.max_workers, available_mb
+            )
+            persistent_pool = (config.max_workers, full_workers)
 
         logger.info(
-            "Pipeline: %d files, %d pool workers, %d jobs/file",
+            "Pipeline: %d files, %d pool workers, %d jobs/file (%d usable cores, %d MB free)",
             num_files,
             pool_workers,
             jobs_per_file,
+            total_cores,
+            available_mb,
         )
 
+        # When every file runs at once, weight ocrmypdf jobs by page count
+        jobs_by_path: dict[Path, int] = {}
+        page_count_by_path: dict[Path, int] = {}
+        if 1 < num_files <= pool_workers:
+            page_counter = _get_worker_processor()
+            page_counts = [page_counter.get_page_count(p) for p in input_files]
+            page_count_by_path = dict(zip(input_files, page_counts))
+            jobs_by_path = dict(
+                zip(input_files, _jobs_by_page_count(page_counts, total_cores))
+            )
+        elif num_files > pool_workers:
+            # Files queue up: submit the largest first (longest-processing-time
+            # order) so a big scan does not start last and stretch the tail
+            input_files.sort(key=lambda p: p.stat().st_size, reverse=True)
+
         # Prepare config dict (picklable)
         config_dict = {
             "langs_tesseract": config.langs_tesseract.split(","),
@@ -365,7 +985,25 @@ def run_pipeline(
             "max_samples": config.max_samples,
             "jobs_per_file": jobs_per_file,
             "diagnostics": config.diagnostics,
+            "keep_intermediates": config.keep_intermediates,
         }
+        if log_run is not None:
+            config_dict["log_run"] = log_run
+            config_dict["log_dir"] = log_dir
+            config_dict["log_level"] = logging.getLogger().getEffectiveLevel()
+
+        # Content-addressed result cache (opt-in)
+        result_cache = None
+        cache_keys: dict[str, str] = {}
+        cache_hits: set[str] = set()
+        cache_stored: set[str] = set()
+        if config.use_cache:
+            from .cache import ResultCache, cache_key
+
+            result_cache = ResultCache(config.output_dir / ".cache")
+            cache_settings = {k: config_dict[k] for k in _CACHE_KEY_SETTINGS}
+            cache_settings["force_surya"] = config.force_surya
+            cache_settings["surya_dtype"] = config.surya_dtype
 
         # --- Phase 1: Parallel Tesseract ---
         cb.on_phase(
@@ -380,22 +1018,90 @@ def run_pipeline(
         file_results: list[FileResult] = []
         completed = 0
 
-        with ProcessPoolExecutor(
-            max_workers=pool_workers,
-            initializer=worker_log_initializer,
-            initargs=(log_queue, log_dir),
+        with _tesseract_pool(
+            pool_workers,
+            log_queue,
+            log_dir,
+            logging.getLogger().getEffectiveLevel(),
+            reuse=persistent_pool,
         ) as executor:
             future_to_path = {}
             for path in input_files:
-                future = executor.submit(_tesseract_worker, path, config.output_dir, config_dict)
+                if result_cache is not None:
+                    key = cache_key(path, cache_settings)
+                    cache_keys[path.name] = key
+                    cached = _restore_from_cache(
+                        result_cache, key, path, config.output_dir / "final"
+                    )
+                    if cached is not None:
+                        logger.info("%s: served from result cache", path.name)
+                        file_results.append(cached)
+                        cache_hits.add(path.name)
+                        completed += 1
+                        cb.on_progress(
+                            ProgressEvent(
+                                phase="tesseract",
+                                current=completed,
+                                total=num_files,
+                                filename=cached.filename,
+                            )
+                        )
+                        continue
+                file_config = config_dict
+                if path in jobs_by_path:
+                    # Workers reuse the page count instead of reopening the PDF
+                    file_config = {
+                        **config_dict,
+                        "jobs_per_file": jobs_by_path[path],
+                        "page_count": page_count_by_path[path],
+                    }
+                future = executor.submit(_tesseract_worker, path, config.output_dir, file_config)
                 future_to_path[future] = path
 
+            # The first pool_workers files are read right away; warm the page
+            # cache for the next wave and keep one file ahead per completion
+            queued = list(future_to_path.values())[pool_workers:]
+            _prefetch(queued[:pool_workers])
+            next_prefetch = pool_workers
+
             for future in as_completed(future_to_path):
                 path = future_to_path[future]
+                if next_prefetch < len(queued):
+                    _prefetch([queued[next_prefetch]])
+                    next_prefetch += 1
                 try:
                     result = future.result(timeout=config.timeout)
                     file_results.append(result)
                     completed += 1
+                    # A file Surya will not touch is final now; cache it right away
+                    # so a rerun after a crash or interrupt resumes from here
+                    if (
+                        result_cache is not None
+                        and result.success
+                        and result.output_path
+                        and not config.force_surya
+                        and not any(p.flagged for p in result.pages)
+                    ):
+                        _store_in_cache(
+                            result_cache,
+                            cache_keys[path.name],
+                            result,
+                            config.output_dir / "final",
+                        )
+                        cache_stored.add(result.filename)
+                    # Hide the torch import behind the remaining Tesseract work.
+                    # The models themselves load after Phase 1, once memory
+                    # can be measured without the Tesseract workers
+                    if warmup_pool is None and (
+                        any(p.flagged for p in result.pages)
+                        or (config.force_surya and result.pages)
+                    ):
+                        logger.info(
+                            "%s: flagged pages found, importing torch in background",
+                            result.filename,
+                        )
+                        warmup_pool = ThreadPoolExecutor(max_workers=1)
+                        warmup_pool.submit(_preimport_torch)
                     cb.on_progress(
                         ProgressEvent(
                             phase="tesseract",
@@ -434,7 +1140,7 @@ def run_pipeline(
                             quality_score=0.0,
                             page_count=0,
                             pages=[],
-                            error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}",
+                            error=_format_error(e),
                         )
                     )
 
@@ -448,29 +1154,37 @@ def run_pipeline(
         )
 
         # --- Phase 2: Cross-file batched Surya (BATCH-04) ---
-        flagged_results = [r for r in file_results if config.force_surya or r.flagged_pages]
+        # For force_surya mode, ensure all pages are flagged
+        if config.force_surya:
+            for fr in file_results:
+                for page in fr.pages:
+                    page.flagged = True
+
+        # Scan each file's pages once; reused for filtering, counting and batching
+        # (pages already Surya-processed, e.g. from a cache hit, are not re-run)
+        flagged_by_file = {
+            r.filename: [p for p in r.flagged_pages if p.engine != OCREngine.SURYA]
+            for r in file_results
+        }
+        flagged_results = [
+            r for r in file_results if config.force_surya or flagged_by_file[r.filename]
+        ]
+        total_flagged_pages = sum(len(flagged_by_file[r.filename]) for r in flagged_results)
 
-        if flagged_results:
+        # Pure-Tesseract runs never touch the batch/surya/torch import chain
+        if total_flagged_pages > 0:
+            from . import surya
             from .batch import (
                 check_memory_pressure,
                 collect_flagged_pages,
                 compute_safe_batch_size,
-                configure_surya_batch_sizes,
                 create_combined_pdf,
-                get_available_memory_gb,
                 map_results_to_files,
                 split_into_batches,
             )
-            from .quality import QualityAnalyzer
+            from .model_cache import cleanup_between_documents
             from .surya import SuryaConfig
 
-            # For force_surya mode, ensure all pages are flagged
-            if config.force_surya:
-                for fr in flagged_results:
-                    for page in fr.pages:
-                        page.flagged = True
-
-            total_flagged_pages = sum(len(r.flagged_pages) for r in flagged_results)
             logger.info(
                 "Phase 2: Surya OCR — %d files, %d flagged pages (cross-file batch)",
                 len(flagged_results),
@@ -486,12 +1200,6 @@ def run_pipeline(
                 )
             )
 
-            # Configure batch sizes BEFORE model loading (BATCH-02, BATCH-03)
-            # This must happen before any marker/Surya imports
-            available_mem = get_available_memory_gb()
-            batch_config = configure_surya_batch_sizes("mps", available_mem)
-            logger.info("Surya batch config: %s (memory: %.1fGB)", batch_config, available_mem)
-
             # Check memory pressure before batch (BATCH-05)
             is_constrained, current_available = check_memory_pressure()
             if is_constrained:
@@ -504,26 +1212,31 @@ def run_pipeline(
                     safe_size,
                 )
 
-            # Load models once (via cache for MODEL-01)
             cb.on_model(ModelEvent(model_name="surya", status="loading"))
-            cache = ModelCache.get_instance()
-            t0 = time.time()
-            model_dict, device_used = cache.get_models()
-            mps_sync()  # Ensure GPU work completes before timing
-            surya_model_load_time = time.time() - t0
+            model_dict, device_used, surya_model_load_time = _load_surya_models(
+                config.surya_dtype
+            )
             cb.on_model(
-                ModelEvent(model_name="surya", status="loaded", time_seconds=surya_model_load_time)
+                ModelEvent(
+                    model_name="surya",
+                    status="loaded",
+                    time_seconds=surya_model_load_time,
+                    dtype=config.surya_dtype,
+                )
             )
 
             # Build input_paths mapping
             input_paths = {p.name: p for p in input_files}
 
             # Collect all flagged pages across all files (BATCH-04)
-            flagged_pages = collect_flagged_pages(flagged_results, input_paths)
+            flagged_pages = collect_flagged_pages(flagged_results, input_paths, flagged_by_file)
 
             # Split into batches based on memory (BATCH-05 gap closure)
             batches = split_into_batches(
-                flagged_pages, current_available, device_used or "mps"
+                flagged_pages,
+                current_available,
+                device_used or "mps",
+                max_pages=config.surya_pages_per_call,
             )
             logger.info(
                 "Cross-file batch: %d pages from %d files in %d sub-batch(es)",
@@ -535,13 +1248,21 @@ def run_pipeline(
             if flagged_pages:
                 try:
                     surya_cfg = SuryaConfig(langs=config.langs_surya)
-                    analyzer = QualityAnalyzer(
-                        config.quality_threshold, max_samples=config.max_samples
+                    # One PdfConverter for all sub-batches, released with this run
+                    converters: dict = {}
+                    # Shared with earlier runs in this process (MCP server)
+                    analyzer = _get_worker_analyzer(
+                        config.quality_threshold, config.max_samples
                     )
 
                     # Process each sub-batch separately (BATCH-05)
                     total_inference_time = 0.0
                     any_fallback = False
+                    pre_surya_texts: dict[tuple[str, int], str | None] = {}
+                    work_dir = config.output_dir / "work"
+                    next_combined: Future | None = None
+                    if len(batches) > 1:
+                        combine_pool = ThreadPoolExecutor(max_workers=1)
                     for batch_idx, sub_batch in enumerate(batches):
                         if not sub_batch:
                             continue
@@ -553,11 +1274,24 @@ def run_pipeline(
                             len(sub_batch),
                         )
 
-                        # Create combined PDF for this sub-batch
-                        combined_pdf = (
-                            config.output_dir / "work" / f"_surya_batch_{batch_idx}.pdf"
-                        )
-                        create_combined_pdf(sub_batch, combined_pdf)
+                        # Create combined PDF for this sub-batch, unless it was
+                        # already built in the background during the previous one
+                        combined_pdf = work_dir / f"_surya_batch_{batch_idx}.pdf"
+                        if next_combined is not None:
+                            next_combined.result()
+                            next_combined = None
+                        else:
+                            create_combined_pdf(sub_batch, combined_pdf)
+
+                        # PyMuPDF page copying overlaps the GIL-free Surya inference
+                        if combine_pool is not None and batch_idx + 1 < len(batches):
+                            next_batch = batches[batch_idx + 1]
+                            if next_batch:
+                                next_combined = combine_pool.submit(
+                                    create_combined_pdf,
+                                    next_batch,
+                                    work_dir / f"_surya_batch_{batch_idx + 1}.pdf",
+                                )
 
                         # Surya call for this sub-batch
                         t_inference = time.time()
@@ -567,10 +1301,19 @@ def run_pipeline(
                             config=surya_cfg,
                             page_range=None,
                             strict_gpu=config.strict_gpu,
+                            converters=converters,
                         )
-                        mps_sync()
+                        # No per-sub-batch mps_sync(): convert returns host-side text, and
+                        # a barrier per tiny sub-batch only drains the Metal queue
                         batch_inference_time = time.time() - t_inference
                         total_inference_time += batch_inference_time
+                        logger.debug(
+                            "Sub-batch %d/%d: %d pages in %.1fs",
+                            batch_idx + 1,
+                            len(batches),
+                            len(sub_batch),
+                            batch_inference_time,
+                        )
 
                         if fallback_occurred:
                             any_fallback = True
@@ -592,6 +1335,12 @@ def run_pipeline(
                                     "DIAG-04: Tesseract text preservation failed"
                                 )
 
+                        # Keep the Tesseract text in case Surya returns nothing for a page
+                        for fp in sub_batch:
+                            pre_surya_texts[(fp.file_result.filename, fp.page_number)] = (
+                                fp.file_result.pages[fp.page_number].text
+                            )
+
                         # Map results back for this sub-batch
                         map_results_to_files(sub_batch, surya_markdown, analyzer)
 
@@ -628,6 +1377,7 @@ def run_pipeline(
                         if len(batches) > 1:
                             cleanup_between_documents()
 
+                    mps_sync()  # Single barrier once every sub-batch has been submitted
                     surya_inference_time = total_inference_time
 
                     # Update file_result metadata
@@ -671,23 +1421,30 @@ def run_pipeline(
                                         page.page_number,
                                     )
 
-                    # Update .txt files with Surya-enhanced text
-                    for file_result in flagged_results:
-                        text_path = (
-                            config.output_dir
-                            / "final"
-                            / f"{Path(file_result.filename).stem}.txt"
-                        )
+                    # Update .txt files with Surya-enhanced text. Skipped when the
+                    # .txt files are deleted at the end of the run anyway.
+                    keep_txt = config.extract_text or config.use_cache
+                    final_dir = config.output_dir / "final"
+                    for file_result in flagged_results if keep_txt else ():
+                        text_path = final_dir / f"{Path(file_result.filename).stem}.txt"
                         if text_path.exists():
-                            existing_text = text_path.read_text(encoding="utf-8")
-                            page_texts = existing_text.split("\n\n")
+                            # Rebuild from in-memory page texts instead of re-reading and
+                            # re-splitting the post-processed file on disk
+                            page_texts = []
+                            changed = False
                             for page in file_result.pages:
-                                if page.engine == OCREngine.SURYA and page.text:
-                                    if page.page_number < len(page_texts):
-                                        page_texts[page.page_number] = page.text
-                            text_path.write_text(
-                                _postprocess("\n\n".join(page_texts)), encoding="utf-8"
-                            )
+                                text = page.text
+                                key = (file_result.filename, page.page_number)
+                                if key in pre_surya_texts:
+                                    if not text:
+                                        text = pre_surya_texts[key]
+                                    changed = changed or text != pre_surya_texts[key]
+                                page_texts.append(text or "")
+                            # Unchanged pages reproduce the Tesseract .txt exactly
+                            if changed:
+                                _write_text_atomic(
+                                    text_path, _postprocess("\n\n".join(page_texts))
+                                )
 
                     # Report progress
                     for idx, file_result in enumerate(flagged_results, 1):
@@ -739,8 +1496,7 @@ def run_pipeline(
         for file_result in file_results:
             if file_result.pages:
                 page_scores = [p.quality_score for p in file_result.pages]
-                if page_scores:
-                    file_result.quality_score = sum(page_scores) / len(page_scores)
+                file_result.quality_score = sum(page_scores) / len(page_scores)
 
         # --- Write JSON metadata files ---
         final_dir = config.output_dir / "final"
@@ -749,7 +1505,20 @@ def run_pipeline(
                 stem = Path(file_result.output_path).stem
                 metadata = file_result.to_dict(include_text=False)
                 json_path = final_dir / f"{stem}.json"
-                json_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+                _write_text_atomic(json_path, json.dumps(metadata, indent=2))
+
+        # --- Store results for unchanged re-runs (before .txt cleanup) ---
+        if result_cache is not None:
+            surya_touched = {r.filename for r in flagged_results} if total_flagged_pages else set()
+            for file_result in file_results:
+                key = cache_keys.get(file_result.filename)
+                if key is None or not (file_result.success and file_result.output_path):
+                    continue
+                if file_result.filename in cache_stored:
+                    continue
+                if file_result.filename in cache_hits and file_result.filename not in surya_touched:
+                    continue
+                _store_in_cache(result_cache, key, file_result, final_dir)
 
         # --- Write diagnostic sidecar files (DIAG-08, --diagnostics only) ---
         if config.diagnostics:
@@ -788,9 +1557,8 @@ def run_pipeline(
                         sidecar_path = (
                             final_dir / f"{stem}.diagnostics.json"
                         )
-                        sidecar_path.write_text(
-                            json.dumps(sidecar, indent=2, default=str),
-                            encoding="utf-8",
+                        _write_text_atomic(
+                            sidecar_path, json.dumps(sidecar, indent=2, default=str)
                         )
                     except Exception:
                         logger.warning(
@@ -800,8 +1568,7 @@ def run_pipeline(
 
         # --- Clean up .txt files unless extract_text enabled ---
         if not config.extract_text:
-            for txt_file in final_dir.glob("*.txt"):
-                txt_file.unlink(missing_ok=True)
+            _remove_all(final_dir.glob("*.txt"))
 
         # --- Cleanup work directory ---
         work_dir = config.output_dir / "work"
@@ -832,4 +1599,11 @@ def run_pipeline(
             },
         )
     finally:
-        stop_logging(log_listener)
+        if warmup_pool is not None:
+            warmup_pool.shutdown(wait=False)
+        if combine_pool is not None:
+            combine_pool.shutdown(wait=True, cancel_futures=True)
+        if log_run is not None:
+            stop_run_logging(log_queue, log_run)
+        else:
+            stop_logging(log_listener)
@@ -23,22 +23,52 @@ _HYPHENATED_NAMES: frozenset[str] = frozenset({
     "buber-rosenzweig",
 })
 
+# The same names as (left, right) parts, so a match can be checked without
+# first building the hyphenated string
+_HYPHENATED_PARTS: frozenset[tuple[str, ...]] = frozenset(
+    tuple(name.split("-")) for name in _HYPHENATED_NAMES
+)
+
 _SOFT_HYPHEN = "\u00AD"
 
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\n+")
+# A match can only start where a word does; the \b stops the engine from
+# retrying \w+ at every letter inside words that do not end in a hyphen
+_LINE_BREAK_HYPHEN_RE = re.compile(r"\b(\w+)-\n(\w+)")
+
+# normalize_punctuation in one scan. At each whitespace run the alternatives
+# give the same result (and fix count) as the former sequential passes: drop
+# whitespace before punctuation, strip spaces/tabs at line or text end, then
+# collapse repeated spaces. The first two can only match from the start of a
+# run, and the lookbehinds say so; without them every position inside a long
+# run rescans to its end, which is quadratic in the run length.
+_PUNCT_WS_RE = re.compile(
+    r"(?P<punct>(?<!\s)\s+(?=[.,;:!?]))|(?P<eol>(?<![ \t])[ \t]+(?=\n|\Z))|  +"
+)
+_MULTI_SPACE_RE = re.compile(r"  +")
+
 
 def normalize_unicode(text: str, counts: dict | None = None) -> str:
     """NFC-normalize, decompose ligatures, remove soft hyphens."""
     total_replacements = 0
-    # Decompose ligatures first (before NFC which won't touch them)
-    for lig, replacement in _LIGATURES.items():
+    # Ligatures and soft hyphens are non-ASCII and ASCII is already NFC, so
+    # pure-ASCII text (a flag CPython keeps on the string) needs no work
+    if text.isascii():
         if counts is not None:
-            before_len = text.count(lig)
-            total_replacements += before_len
-        text = text.replace(lig, replacement)
+            counts["unicode_normalizations"] = counts.get("unicode_normalizations", 0)
+        return text
+    # Decompose ligatures first (before NFC which won't touch them). Most
+    # pages have none, so count once and only rebuild the string on a hit.
+    for lig, replacement in _LIGATURES.items():
+        n = text.count(lig)
+        if n:
+            total_replacements += n
+            text = text.replace(lig, replacement)
     # Remove soft hyphens
-    if counts is not None:
-        total_replacements += text.count(_SOFT_HYPHEN)
-    text = text.replace(_SOFT_HYPHEN, "")
+    n = text.count(_SOFT_HYPHEN)
+    if n:
+        total_replacements += n
+        text = text.replace(_SOFT_HYPHEN, "")
     # NFC normalize
     text = unicodedata.normalize("NFC", text)
     if counts is not None:
@@ -50,42 +80,37 @@ def normalize_unicode(text: str, counts: dict | None = None) -> str:
 def join_paragraphs(text: str, counts: dict | None = None) -> str:
     """Join single-newline lines within paragraphs, preserve paragraph boundaries."""
     join_count = 0
-    # Split on double newlines to get paragraph blocks
-    blocks = re.split(r"\n\n+", text)
-    result_blocks = []
+    parts: list[str] = []
 
-    for block in blocks:
+    # Split on double newlines to get paragraph blocks
+    for block in _PARAGRAPH_BREAK_RE.split(text):
+        if parts:
+            parts.append("\n\n")
         lines = block.split("\n")
         if len(lines) <= 1:
-            result_blocks.append(block)
+            parts.append(block)
             continue
 
-        merged_lines: list[str] = []
+        prev_len = 0  # stripped length of the previous line
         for i, line in enumerate(lines):
             stripped = line.rstrip()
-            # Check if this line is indented (starts new paragraph within block)
-            if line and line[0] in (" ", "\t") and i > 0:
-                merged_lines.append("\n" + line)
-                continue
-            # Check if previous line is short (heading-like): < 60 chars
-            if i > 0 and merged_lines:
-                prev = merged_lines[-1].rstrip()
-                # If previous line is short and current starts with uppercase, keep separate
-                if len(prev.replace("\n", "").strip()) < 60 and stripped and stripped[0].isupper():
-                    merged_lines.append("\n" + stripped)
-                    continue
             if i == 0:
-                merged_lines.append(stripped)
+                parts.append(stripped)
+            # Check if this line is indented (starts new paragraph within block)
+            elif line.startswith((" ", "\t")):
+                parts += ("\n", line)
+            # If previous line is short (heading-like: < 60 chars) and current
+            # starts with uppercase, keep separate
+            elif prev_len < 60 and stripped and stripped[0].isupper():
+                parts += ("\n", stripped)
             else:
-                merged_lines.append(" " + stripped)
-                if counts is not None:
-                    join_count += 1
-
-        result_blocks.append("".join(merged_lines))
+                parts += (" ", stripped)
+                join_count += 1
+            prev_len = len(stripped.lstrip())
 
     if counts is not None:
         counts["paragraph_joins"] = counts.get("paragraph_joins", 0) + join_count
-    return "\n\n".join(result_blocks)
+    return "".join(parts)
 
 
 def dehyphenate(text: str, terms: frozenset[str] | None = None, counts: dict | None = None) -> str:
@@ -93,57 +118,50 @@ def dehyphenate(text: str, terms: frozenset[str] | None = None, counts: dict | N
     if terms is None:
         terms = _GarbledSignal.VALID_TERMS
 
-    rejoin_count = [0]  # mutable container for closure access
+    rejoin_count = 0
 
     def _replace_hyphen(m: re.Match) -> str:
-        left = m.group(1)
-        right = m.group(2)
-        hyphenated = f"{left}-{right}"
+        nonlocal rejoin_count
+        left, right = m.group(1, 2)
 
         # Keep hyphen for known proper names
-        if hyphenated.lower() in _HYPHENATED_NAMES:
-            return hyphenated
+        if (left.lower(), right.lower()) in _HYPHENATED_PARTS:
+            return f"{left}-{right}"
 
         # Keep hyphen if both parts are capitalized (proper name heuristic)
         if left[0].isupper() and right[0].isupper():
-            return hyphenated
+            return f"{left}-{right}"
 
         # Rejoin: either it's in valid terms or it's a line-break hyphen (common OCR case)
-        if counts is not None:
-            rejoin_count[0] += 1
+        rejoin_count += 1
         return left + right
 
     # Only match hyphens at line breaks
-    result = re.sub(r"(\w+)-\n(\w+)", _replace_hyphen, text)
+    result = _LINE_BREAK_HYPHEN_RE.sub(_replace_hyphen, text)
     if counts is not None:
-        counts["dehyphenations"] = counts.get("dehyphenations", 0) + rejoin_count[0]
+        counts["dehyphenations"] = counts.get("dehyphenations", 0) + rejoin_count
     return result
 
 
 def normalize_punctuation(text: str, counts: dict | None = None) -> str:
     """Collapse whitespace around punctuation."""
+    total_fixes = 0
+
+    def _fix(m: re.Match) -> str:
+        nonlocal total_fixes
+        total_fixes += 1
+        if m.lastgroup == "punct":
+            return ""
+        if m.lastgroup == "eol":
+            # Collapsing spaces inside the run used to count separately
+            if counts is not None:
+                total_fixes += len(_MULTI_SPACE_RE.findall(m.group()))
+            return ""
+        return " "
+
+    text = _PUNCT_WS_RE.sub(_fix, text)
     if counts is not None:
-        total_fixes = 0
-        # Remove space before punctuation
-        text, n = re.subn(r"\s+([.,;:!?])", r"\1", text)
-        total_fixes += n
-        # Collapse multiple spaces
-        text, n = re.subn(r"  +", " ", text)
-        total_fixes += n
-        # Strip trailing whitespace per line
-        text, n = re.subn(r"[ \t]+(\n)", r"\1", text)
-        total_fixes += n
-        text, n = re.subn(r"[ \t]+$", "", text)
-        total_fixes += n
         counts["punctuation_fixes"] = counts.get("punctuation_fixes", 0) + total_fixes
-    else:
-        # Remove space before punctuation
-        text = re.sub(r"\s+([.,;:!?])", r"\1", text)
-        # Collapse multiple spaces
-        text = re.sub(r"  +", " ", text)
-        # Strip trailing whitespace per line
-        text = re.sub(r"[ \t]+(\n)", r"\1", text)
-        text = re.sub(r"[ \t]+$", "", text)
     return text
 
 
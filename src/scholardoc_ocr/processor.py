@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import fitz
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _cached_page_count(path: str, size: int, mtime_ns: int) -> int:
+    """Page count of the PDF at *path*; size and mtime key out stale entries."""
+    import fitz
+
+    with fitz.open(path) as doc:
+        return len(doc)
+
+
 @dataclass
 class ProcessingResult:
     """Result of processing a single PDF."""
@@ -82,14 +95,43 @@ class PDFProcessor:
             logger.warning("Page extraction failed for %s: %s", pdf_path, e, exc_info=True)
             return []
 
+    def iter_text_by_page(
+        self, pdf_path: Path, image_check_chars: int = 0
+    ) -> Iterator[tuple[str, bool]]:
+        """Yield ``(text, image_only)`` for each page in turn.
+
+        Lets a caller stop partway through without extracting the remaining
+        pages; close the generator (or exhaust it) to release the document.
+        Unlike :meth:`extract_text_by_page`, read errors are raised rather than
+        logged, so a caller can tell a failed read from a short document.
+
+        Args:
+            pdf_path: PDF to read.
+            image_check_chars: A page with less stripped text than this that
+                draws an image is reported as image-only. Images are listed
+                only for such near-empty pages; 0 disables the check.
+        """
+        with self._open_pdf(pdf_path) as doc:
+            for page in doc:
+                text = page.get_text()
+                image_only = len(text.strip()) < image_check_chars and bool(page.get_images())
+                yield text, image_only
+
     def extract_pages(self, pdf_path: Path, page_numbers: list[int], output_path: Path) -> bool:
         """Extract specific pages (0-indexed) to a new PDF."""
         try:
             with self._open_pdf(pdf_path) as doc:
+                # Consecutive pages are copied with one insert_pdf call each run
+                runs: list[tuple[int, int]] = []
+                for page_num in page_numbers:
+                    if 0 <= page_num < len(doc):
+                        if runs and runs[-1][1] == page_num - 1:
+                            runs[-1] = (runs[-1][0], page_num)
+                        else:
+                            runs.append((page_num, page_num))
                 with self._open_pdf() as new_doc:
-                    for page_num in page_numbers:
-                        if 0 <= page_num < len(doc):
-                            new_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
+                    for first, last in runs:
+                        new_doc.insert_pdf(doc, from_page=first, to_page=last)
                     new_doc.save(output_path)
             return True
         except Exception as e:
@@ -130,10 +172,14 @@ class PDFProcessor:
             return False
 
     def get_page_count(self, pdf_path: Path) -> int:
-        """Get page count using PyMuPDF."""
+        """Get page count using PyMuPDF.
+
+        Counts are cached per file version, so repeated runs over the same
+        inputs (e.g. from the MCP server) skip reopening unchanged PDFs.
+        """
         try:
-            with self._open_pdf(pdf_path) as doc:
-                return len(doc)
+            st = os.stat(pdf_path)
+            return _cached_page_count(str(pdf_path), st.st_size, st.st_mtime_ns)
         except Exception:
             logger.warning("Failed to get page count for %s", pdf_path, exc_info=True)
             return 0
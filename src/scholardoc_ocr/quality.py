@@ -5,13 +5,14 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable
 
 from scholardoc_ocr.confidence import ConfidenceSignal
 from scholardoc_ocr.dictionary import DictionarySignal
 from scholardoc_ocr.types import SignalResult
 
 
-@dataclass
+@dataclass(slots=True)
 class QualityResult:
     """Result of quality analysis."""
 
@@ -28,6 +29,16 @@ class QualityResult:
     snippets: list[str] = field(default_factory=list)
 
 
+def _union(patterns: Iterable[re.Pattern]) -> re.Pattern:
+    """One alternation matching wherever any of *patterns* would.
+
+    Scoped (?i:...) groups keep each pattern's own IGNORECASE flag.
+    """
+    return re.compile(
+        "|".join(f"(?{'i' if p.flags & re.IGNORECASE else ''}:{p.pattern})" for p in patterns)
+    )
+
+
 class _GarbledSignal:
     """Internal garbled-text detection signal using regex patterns.
 
@@ -41,6 +52,22 @@ class _GarbledSignal:
         (re.compile(r"\b[A-Z][a-z]+[A-Z][a-z]*\b"), "weird_case"),
         (re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]"), "control_char"),
     ]
+    # The subset that can match a word made only of letters
+    _ALPHA_PATTERNS = [
+        (pattern, ptype)
+        for pattern, ptype in PATTERNS
+        if ptype in ("consonant_cluster", "weird_case")
+    ]
+    # Either pattern list as one alternation, indexed by whether the word has
+    # a German suffix (which exempts it from consonant_cluster)
+    _ANY_PATTERN = (
+        _union(p for p, _ in PATTERNS),
+        _union(p for p, ptype in PATTERNS if ptype != "consonant_cluster"),
+    )
+    _ANY_ALPHA_PATTERN = (
+        _union(p for p, _ in _ALPHA_PATTERNS),
+        _union(p for p, ptype in _ALPHA_PATTERNS if ptype != "consonant_cluster"),
+    )
 
     _HEIDEGGER_TERMS = frozenset({
         "erschlossenheit", "befindlichkeit", "geworfenheit", "eigentlichkeit",
@@ -129,6 +156,10 @@ class _GarbledSignal:
         re.compile(r"^\d[\d.\-–—/]+\d$"),
     ]
 
+    # VALID_PATTERNS as one alternation: one match() call per word instead of
+    # up to sixteen
+    _VALID_RE = _union(VALID_PATTERNS)
+
     def __init__(self, threshold: float = 0.85, max_samples: int = 10):
         self.threshold = threshold
         self.max_samples = max_samples
@@ -169,29 +200,40 @@ class _GarbledSignal:
 
         for idx, word in enumerate(words):
             word_clean = word.strip(".,;:!?()[]{}\"'-–—")
-            if len(word_clean) < 2 or word_clean.lower() in self.VALID_SHORT:
+            if len(word_clean) < 2:
+                continue
+            word_lower = word_clean.lower()
+            if word_lower in self.VALID_SHORT:
                 continue
 
-            is_valid_reference = any(p.match(word_clean) for p in self.VALID_PATTERNS)
-            if is_valid_reference:
+            if self._VALID_RE.match(word_clean):
                 continue
 
-            if word_clean.lower() in self.VALID_TERMS:
+            if word_lower in self.VALID_TERMS:
                 continue
 
             is_garbled = False
             issue_type = None
 
-            alpha_count = sum(c.isalpha() for c in word_clean)
-            if len(word_clean) > 0:
+            if word_clean.isalpha():
+                # One C-level scan: an all-letter word cannot be low_alpha,
+                # a symbol_run or a control_char, so skip those checks
+                patterns = self._ALPHA_PATTERNS
+                any_pattern = self._ANY_ALPHA_PATTERN
+            else:
+                patterns = self.PATTERNS
+                any_pattern = self._ANY_PATTERN
+                alpha_count = sum(c.isalpha() for c in word_clean)
                 alpha_ratio = alpha_count / len(word_clean)
                 if alpha_ratio < 0.3 and len(word_clean) > 4:
                     is_garbled = True
                     issue_type = "low_alpha"
 
-            if not is_garbled:
-                has_german_suffix = word_clean.lower().endswith(self.GERMAN_SUFFIXES)
-                for pattern, ptype in self.PATTERNS:
+            has_german_suffix = word_lower.endswith(self.GERMAN_SUFFIXES)
+            # One search decides whether any pattern hits; the ordered loop
+            # then runs only on hits, to report the first matching type
+            if not is_garbled and any_pattern[has_german_suffix].search(word_clean):
+                for pattern, ptype in patterns:
                     if ptype == "consonant_cluster" and has_german_suffix:
                         continue
                     if pattern.search(word_clean):
@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Accepted load_models() dtype names and their torch attribute names
+_TORCH_DTYPES = {"fp32": "float32", "fp16": "float16", "bf16": "bfloat16"}
+
 
 @dataclass
 class SuryaConfig:
@@ -43,12 +46,14 @@ def is_available() -> bool:
         return False
 
 
-def load_models(device: str | None = None) -> tuple[dict[str, Any], str]:
+def load_models(device: str | None = None, dtype: str | None = None) -> tuple[dict[str, Any], str]:
     """Load Surya/Marker models once for reuse across convert_pdf calls.
 
     Args:
         device: Optional device string (e.g. "cpu", "cuda:0"). If None,
             auto-detects the best available device using detect_device().
+        dtype: Optional weight dtype: "fp32", "fp16" or "bf16". If None,
+            Surya's per-device default is used.
 
     Returns:
         Tuple of (model_dict, device_used_str) where:
@@ -56,8 +61,14 @@ def load_models(device: str | None = None) -> tuple[dict[str, Any], str]:
         - device_used_str is the actual device string used (e.g., "mps", "cuda", "cpu")
 
     Raises:
-        SuryaError: If model loading fails.
+        SuryaError: If model loading fails or dtype is unknown.
     """
+    if dtype is not None and dtype not in _TORCH_DTYPES:
+        raise SuryaError(
+            f"Unsupported Surya dtype: {dtype}",
+            details={"dtype": dtype, "supported": sorted(_TORCH_DTYPES)},
+        )
+
     try:
         from marker.models import create_model_dict  # noqa: PLC0415
     except ImportError as exc:
@@ -79,26 +90,60 @@ def load_models(device: str | None = None) -> tuple[dict[str, Any], str]:
         device_str = str(device_info.device_type)
         logger.info("Using device: %s (%s)", device_info.device_type, device_info.device_name)
 
-    logger.info("Loading Surya/Marker models on device: %s", device_str)
+    logger.info("Loading Surya/Marker models on device: %s (dtype: %s)", device_str, dtype)
     try:
         import torch  # noqa: PLC0415
 
-        model_dict = create_model_dict(device=torch.device(device_str))
+        if dtype is None:
+            model_dict = create_model_dict(device=torch.device(device_str))
+        else:
+            model_dict = create_model_dict(
+                device=torch.device(device_str), dtype=getattr(torch, _TORCH_DTYPES[dtype])
+            )
     except Exception as exc:
         raise SuryaError(
             f"Failed to load Surya/Marker models: {exc}",
-            details={"device": device_str, "requested_device": device},
+            details={"device": device_str, "requested_device": device, "dtype": dtype},
         ) from exc
 
     logger.info("Surya/Marker models loaded successfully on %s.", device_str)
     return model_dict, device_str
 
 
+def _get_converter(
+    converter_cls: Any,
+    model_dict: dict[str, Any],
+    converter_config: dict[str, Any],
+    converters: dict[tuple, tuple[dict[str, Any], Any]] | None,
+) -> Any:
+    """Return a PdfConverter for these models and config.
+
+    With a *converters* dict, a converter already built for the same model
+    dict and config is reused; without one, a new converter is built.
+    """
+    if converters is None:
+        return converter_cls(artifact_dict=model_dict, config=converter_config)
+
+    key = (
+        tuple(converter_config["languages"]),
+        converter_config["force_ocr"],
+        tuple(converter_config.get("page_range") or ()),
+    )
+    cached = converters.get(key)
+    if cached is not None and cached[0] is model_dict:
+        return cached[1]
+
+    converter = converter_cls(artifact_dict=model_dict, config=converter_config)
+    converters[key] = (model_dict, converter)
+    return converter
+
+
 def convert_pdf(
     input_path: Path,
     model_dict: dict[str, Any],
     config: SuryaConfig | None = None,
     page_range: list[int] | None = None,
+    converters: dict[tuple, tuple[dict[str, Any], Any]] | None = None,
 ) -> str:
     """Convert a PDF to markdown text using Surya/Marker OCR.
 
@@ -107,6 +152,10 @@ def convert_pdf(
         model_dict: Pre-loaded model dictionary from load_models().
         config: Surya configuration. Uses defaults if None.
         page_range: Optional list of page indices to process.
+        converters: Optional PdfConverter cache owned by the caller. Passing
+            the same dict to every call in a run builds the converter
+            (processor chain, renderer) once; dropping it at the end of the
+            run releases the converter's model references with it.
 
     Returns:
         Rendered markdown text from the PDF.
@@ -136,10 +185,7 @@ def convert_pdf(
     logger.debug("Converting %s with config: %s", input_path, converter_config)
 
     try:
-        converter = PdfConverter(
-            artifact_dict=model_dict,
-            config=converter_config,
-        )
+        converter = _get_converter(PdfConverter, model_dict, converter_config, converters)
         result: MarkdownOutput = converter(str(input_path))
         return result.markdown
     except Exception as exc:
@@ -156,6 +202,7 @@ def convert_pdf_with_fallback(
     config: SuryaConfig | None = None,
     page_range: list[int] | None = None,
     strict_gpu: bool = False,
+    converters: dict[tuple, tuple[dict[str, Any], Any]] | None = None,
 ) -> tuple[str, bool]:
     """Convert PDF with fallback from GPU to CPU on failure.
 
@@ -169,6 +216,7 @@ def convert_pdf_with_fallback(
         config: Surya configuration.
         page_range: Optional list of page indices.
         strict_gpu: If True, don't fall back to CPU on failure.
+        converters: Optional PdfConverter cache, passed to convert_pdf().
 
     Returns:
         Tuple of (markdown_text, fallback_occurred).
@@ -181,7 +229,7 @@ def convert_pdf_with_fallback(
     error_message = ""
 
     try:
-        markdown = convert_pdf(input_path, model_dict, config, page_range)
+        markdown = convert_pdf(input_path, model_dict, config, page_range, converters=converters)
         return markdown, False
     except RuntimeError as exc:
         if strict_gpu:
@@ -211,7 +259,9 @@ def convert_pdf_with_fallback(
             error_message,
         )
         cpu_model_dict, _ = load_models(device="cpu")
-        markdown = convert_pdf(input_path, cpu_model_dict, config, page_range)
+        markdown = convert_pdf(
+            input_path, cpu_model_dict, config, page_range, converters=converters
+        )
         return markdown, True
 
     # This should never be reached, but satisfy type checker
@@ -74,13 +74,13 @@ def run_ocr(
         logger.error("Missing dependency for Tesseract OCR: %s", exc)
         return TesseractResult(success=False, error=f"Missing dependency: {exc}")
     except Exception as exc:
-        import traceback
-
-        tb = traceback.format_exc()
         error_msg = f"{type(exc).__name__}: {exc}" if str(exc) else f"{type(exc).__name__}: {exc!r}"
-        full_msg = f"{error_msg}\n{tb}"
-        logger.error("Tesseract OCR failed for %s: %s", input_path, full_msg)
-        return TesseractResult(success=False, error=full_msg)
+        logger.error("Tesseract OCR failed for %s: %s", input_path, error_msg, exc_info=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
+
+            error_msg = f"{error_msg}\n{traceback.format_exc()}"
+        return TesseractResult(success=False, error=error_msg)
 
 
 def is_available() -> bool:
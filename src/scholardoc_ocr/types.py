@@ -78,7 +78,7 @@ class PageStatus(StrEnum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class PageResult:
     """Result for a single page."""
 
@@ -180,7 +180,7 @@ class FileResult:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalResult:
     """Result from a quality signal scorer."""
 
@@ -211,7 +211,7 @@ class BatchResult:
     @property
     def flagged_count(self) -> int:
         """Number of files with any flagged pages."""
-        return sum(1 for f in self.files if f.flagged_pages)
+        return sum(1 for f in self.files if any(p.flagged for p in f.pages))
 
     def to_dict(self, include_text: bool = False) -> dict:
         """Convert to a JSON-serializable dictionary."""
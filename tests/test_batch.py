@@ -433,6 +433,16 @@ class TestCollectFlaggedPages:
 
         assert result == []
 
+    def test_uses_precomputed_flagged_mapping(self):
+        """A precomputed flagged_by_file mapping is used instead of rescanning pages."""
+        fr = _make_file_result("doc.pdf", page_count=5, flagged_indices=[0, 1, 2])
+        input_paths = {"doc.pdf": Path("/test/doc.pdf")}
+        flagged_by_file = {"doc.pdf": [fr.pages[2]]}
+
+        result = collect_flagged_pages([fr], input_paths, flagged_by_file)
+
+        assert [p.page_number for p in result] == [2]
+
 
 # =============================================================================
 # Create Combined PDF Tests
@@ -505,6 +515,28 @@ class TestCreateCombinedPdf:
             assert "Doc1 Page2" in text1
             assert "Doc2 Page1" in text2
 
+    def test_shared_image_copied_once(self, tmp_path):
+        """An image drawn on several source pages is stored once in the output."""
+        src = tmp_path / "scan.pdf"
+        doc = fitz.open()
+        pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 8, 8), False)
+        xref = 0
+        for _ in range(3):
+            page = doc.new_page()
+            xref = page.insert_image(fitz.Rect(0, 0, 100, 100), pixmap=pix, xref=xref)
+        doc.save(src)
+        doc.close()
+
+        fr = _make_file_result("scan.pdf", page_count=3, flagged_indices=[0, 1, 2])
+        flagged_pages = collect_flagged_pages([fr], {"scan.pdf": src})
+        output_path = tmp_path / "combined.pdf"
+
+        create_combined_pdf(flagged_pages, output_path)
+
+        with fitz.open(output_path) as combined:
+            xrefs = {img[0] for page in combined for img in page.get_images()}
+        assert len(xrefs) == 1
+
     def test_empty_flagged_pages_does_not_create_file(self, tmp_path):
         """Empty flagged pages logs warning but doesn't create file."""
         output_path = tmp_path / "empty.pdf"
@@ -580,6 +612,23 @@ class TestMapResultsToFiles:
         assert fr.pages[0].text == "first page content"
         assert fr.pages[1].text == "second page content"
 
+    def test_maps_later_sub_batch(self):
+        """A sub-batch whose batch_index does not start at 0 maps by position."""
+        fr = _make_file_result("doc.pdf", page_count=4, flagged_indices=[0, 1, 2, 3])
+        input_paths = {"doc.pdf": Path("/test/doc.pdf")}
+        flagged_pages = collect_flagged_pages([fr], input_paths)
+        second = split_into_batches(flagged_pages, 64.0, "cpu", max_pages=2)[1]
+
+        mock_analyzer = MagicMock()
+        mock_analyzer.threshold = 0.85
+        mock_analyzer.analyze.return_value = MagicMock(score=0.95)
+
+        map_results_to_files(second, "third\n---\nfourth", mock_analyzer)
+
+        assert fr.pages[2].text == "third"
+        assert fr.pages[3].text == "fourth"
+        assert fr.pages[0].engine == OCREngine.TESSERACT
+
     def test_mutates_file_result_in_place(self):
         """Original FileResult is modified."""
         fr = _make_file_result("doc.pdf", page_count=1, flagged_indices=[0])
@@ -981,6 +1030,23 @@ class TestSplitIntoBatches:
         assert len(batches[2]) == 32
         assert len(batches[3]) == 4
 
+    def test_split_respects_max_pages(self):
+        """max_pages caps sub-batches below the memory-derived size."""
+        mock_result = MagicMock(spec=FileResult)
+        pages = [
+            FlaggedPage(
+                file_result=mock_result,
+                page_number=i,
+                input_path=Path("/test/test.pdf"),
+                batch_index=i,
+            )
+            for i in range(20)
+        ]
+
+        batches = split_into_batches(pages, 64.0, "cpu", max_pages=8)
+
+        assert [len(b) for b in batches] == [8, 8, 4]
+
     def test_split_logs_when_splitting(self, caplog):
         """Verify INFO log emitted when splitting occurs."""
         import logging
@@ -0,0 +1,202 @@
+"""Tests for the content-addressed result cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scholardoc_ocr.cache import ResultCache, cache_key, file_digest
+from scholardoc_ocr.pipeline import PipelineConfig, run_pipeline
+from scholardoc_ocr.types import FileResult, OCREngine, PageResult, PageStatus
+
+
+def _file_result(filename: str = "doc.pdf") -> FileResult:
+    return FileResult(
+        filename=filename,
+        success=True,
+        engine=OCREngine.TESSERACT,
+        quality_score=0.95,
+        page_count=1,
+        pages=[
+            PageResult(
+                page_number=0,
+                status=PageStatus.GOOD,
+                quality_score=0.95,
+                engine=OCREngine.TESSERACT,
+                text="cached text",
+            )
+        ],
+    )
+
+
+class TestCacheKey:
+    def test_same_content_same_key(self, tmp_path: Path):
+        a = tmp_path / "a.pdf"
+        b = tmp_path / "b.pdf"
+        a.write_bytes(b"%PDF-1.4 same")
+        b.write_bytes(b"%PDF-1.4 same")
+        assert file_digest(a) == file_digest(b)
+        assert cache_key(a, {"langs": "eng"}) == cache_key(b, {"langs": "eng"})
+
+    def test_settings_change_key(self, tmp_path: Path):
+        a = tmp_path / "a.pdf"
+        a.write_bytes(b"%PDF-1.4")
+        assert cache_key(a, {"langs": "eng"}) != cache_key(a, {"langs": "fra"})
+
+    def test_settings_order_irrelevant(self, tmp_path: Path):
+        a = tmp_path / "a.pdf"
+        a.write_bytes(b"%PDF-1.4")
+        assert cache_key(a, {"x": 1, "y": 2}) == cache_key(a, {"y": 2, "x": 1})
+
+
+class TestResultCache:
+    def test_miss_returns_none(self, tmp_path: Path):
+        assert ResultCache(tmp_path).get("nope") is None
+
+    def test_put_get_restore_roundtrip(self, tmp_path: Path):
+        cache = ResultCache(tmp_path / ".cache")
+        pdf = tmp_path / "doc.pdf"
+        txt = tmp_path / "doc.txt"
+        pdf.write_bytes(b"%PDF-1.4 out")
+        txt.write_text("hello", encoding="utf-8")
+
+        cache.put("k", _file_result(), [pdf, txt])
+
+        result = cache.get("k")
+        assert result is not None
+        assert result.pages[0].text == "cached text"
+
+        dest = tmp_path / "final"
+        dest.mkdir()
+        restored = cache.restore("k", dest, "doc")
+        assert restored[".pdf"].read_bytes() == b"%PDF-1.4 out"
+        assert restored[".txt"].read_text(encoding="utf-8") == "hello"
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        entry = tmp_path / "k"
+        entry.mkdir()
+        (entry / "result.pkl").write_bytes(b"not a pickle")
+        assert ResultCache(tmp_path).get("k") is None
+
+
+class TestPipelineCache:
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_second_run_skips_workers(self, mock_pool_cls, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        (input_dir / "doc.pdf").write_bytes(b"%PDF-1.4 mock")
+        output_dir = tmp_path / "output"
+        config = PipelineConfig(
+            input_dir=input_dir, output_dir=output_dir, files=["doc.pdf"], use_cache=True
+        )
+
+        def _submit(fn, path, out_dir, config_dict):
+            final = out_dir / "final"
+            final.mkdir(parents=True, exist_ok=True)
+            (final / "doc.pdf").write_bytes(b"%PDF-1.4 ocr")
+            result = _file_result()
+            result.output_path = str(final / "doc.pdf")
+            future = MagicMock()
+            future.result.return_value = result
+            return future
+
+        pool = MagicMock()
+        pool.submit.side_effect = _submit
+        pool_ctx = MagicMock()
+        pool_ctx.__enter__ = MagicMock(return_value=pool)
+        pool_ctx.__exit__ = MagicMock(return_value=False)
+        mock_pool_cls.return_value = pool_ctx
+
+        with patch("scholardoc_ocr.pipeline.as_completed", side_effect=lambda fs: iter(list(fs))):
+            run_pipeline(config)
+            (output_dir / "final" / "doc.pdf").unlink()
+            batch = run_pipeline(config)
+
+        assert pool.submit.call_count == 1
+        assert batch.files[0].pages[0].text == "cached text"
+        assert "cache_lookup" in batch.files[0].phase_timings
+        assert (output_dir / "final" / "doc.pdf").read_bytes() == b"%PDF-1.4 ocr"
+
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_interrupted_run_resumes_finished_files(self, mock_pool_cls, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("a.pdf", "b.pdf"):
+            (input_dir / name).write_bytes(f"%PDF-1.4 {name}".encode())
+        output_dir = tmp_path / "output"
+        config = PipelineConfig(input_dir=input_dir, output_dir=output_dir, use_cache=True)
+
+        def _submit(fn, path, out_dir, config_dict):
+            final = out_dir / "final"
+            final.mkdir(parents=True, exist_ok=True)
+            (final / path.name).write_bytes(b"%PDF-1.4 ocr")
+            result = _file_result(path.name)
+            result.output_path = str(final / path.name)
+            future = MagicMock()
+            future.result.return_value = result
+            return future
+
+        pool = MagicMock()
+        pool.submit.side_effect = _submit
+        pool_ctx = MagicMock()
+        pool_ctx.__enter__ = MagicMock(return_value=pool)
+        pool_ctx.__exit__ = MagicMock(return_value=False)
+        mock_pool_cls.return_value = pool_ctx
+
+        def _interrupted(fs):
+            yield list(fs)[0]
+            raise KeyboardInterrupt
+
+        with patch("scholardoc_ocr.pipeline.as_completed", side_effect=_interrupted):
+            with pytest.raises(KeyboardInterrupt):
+                run_pipeline(config)
+
+        pool.submit.reset_mock()
+        with patch("scholardoc_ocr.pipeline.as_completed", side_effect=lambda fs: iter(list(fs))):
+            batch = run_pipeline(config)
+
+        assert [c.args[1].name for c in pool.submit.call_args_list] == ["b.pdf"]
+        assert sorted(f.filename for f in batch.files) == ["a.pdf", "b.pdf"]
+
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_same_content_keeps_own_filename(self, mock_pool_cls, tmp_path: Path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("a.pdf", "b.pdf"):
+            (input_dir / name).write_bytes(b"%PDF-1.4 same content")
+        output_dir = tmp_path / "output"
+
+        def _submit(fn, path, out_dir, config_dict):
+            final = out_dir / "final"
+            final.mkdir(parents=True, exist_ok=True)
+            (final / path.name).write_bytes(b"%PDF-1.4 ocr")
+            result = _file_result(path.name)
+            result.output_path = str(final / path.name)
+            future = MagicMock()
+            future.result.return_value = result
+            return future
+
+        pool = MagicMock()
+        pool.submit.side_effect = _submit
+        pool_ctx = MagicMock()
+        pool_ctx.__enter__ = MagicMock(return_value=pool)
+        pool_ctx.__exit__ = MagicMock(return_value=False)
+        mock_pool_cls.return_value = pool_ctx
+
+        with patch("scholardoc_ocr.pipeline.as_completed", side_effect=lambda fs: iter(list(fs))):
+            run_pipeline(
+                PipelineConfig(
+                    input_dir=input_dir, output_dir=output_dir, files=["a.pdf"], use_cache=True
+                )
+            )
+            batch = run_pipeline(
+                PipelineConfig(input_dir=input_dir, output_dir=output_dir, use_cache=True)
+            )
+
+        # b.pdf is served from a.pdf's entry but reported under its own name
+        assert pool.submit.call_count == 1
+        assert sorted(f.filename for f in batch.files) == ["a.pdf", "b.pdf"]
+        b_result = next(f for f in batch.files if f.filename == "b.pdf")
+        assert b_result.output_path == str(output_dir / "final" / "b.pdf")
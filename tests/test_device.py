@@ -272,7 +272,7 @@ class TestConvertPdfWithFallback:
         # Track which device was used
         calls = []
 
-        def mock_convert_pdf(input_path, model_dict, config=None, page_range=None):
+        def mock_convert_pdf(input_path, model_dict, config=None, page_range=None, converters=None):
             device = model_dict.get("_test_device", "unknown")
             calls.append(device)
             if device != "cpu":
@@ -320,7 +320,7 @@ class TestConvertPdfWithFallback:
         pdf_path = tmp_path / "test.pdf"
         pdf_path.touch()
 
-        def mock_convert_pdf(input_path, model_dict, config=None, page_range=None):
+        def mock_convert_pdf(input_path, model_dict, config=None, page_range=None, converters=None):
             return "successful gpu markdown"
 
         monkeypatch.setattr(surya, "convert_pdf", mock_convert_pdf)
@@ -340,7 +340,7 @@ class TestConvertPdfWithFallback:
         pdf_path = tmp_path / "test.pdf"
         pdf_path.touch()
 
-        def mock_convert_pdf(input_path, model_dict, config=None, page_range=None):
+        def mock_convert_pdf(input_path, model_dict, config=None, page_range=None, converters=None):
             return "markdown"
 
         monkeypatch.setattr(surya, "convert_pdf", mock_convert_pdf)
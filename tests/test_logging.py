@@ -10,7 +10,14 @@ from concurrent.futures import ProcessPoolExecutor
 from logging.handlers import QueueHandler
 from pathlib import Path
 
-from scholardoc_ocr.logging_ import setup_main_logging, stop_logging, worker_log_initializer
+from scholardoc_ocr.logging_ import (
+    set_worker_run,
+    setup_main_logging,
+    start_run_logging,
+    stop_logging,
+    stop_run_logging,
+    worker_log_initializer,
+)
 
 
 def test_setup_main_logging_returns_queue_and_listener():
@@ -38,6 +45,21 @@ def test_worker_log_initializer_adds_queue_handler():
     root.handlers.clear()
 
 
+def test_worker_queue_handler_drops_records_below_level():
+    """Records below *level* are not put on the queue."""
+    log_queue = mp.Queue()
+    worker_log_initializer(log_queue, level=logging.INFO)
+    try:
+        logging.getLogger("test.level").debug("dropped")
+        logging.getLogger("test.level").info("kept")
+
+        record = log_queue.get(timeout=5)
+        assert record.getMessage() == "kept"
+        assert log_queue.empty()
+    finally:
+        logging.getLogger().handlers.clear()
+
+
 def _worker_emit_sentinel(sentinel: str) -> str:
     """Worker task: log a sentinel message (logging already configured via initializer)."""
     logging.getLogger("test.worker").info(sentinel)
@@ -110,8 +132,82 @@ def test_per_worker_log_file_created(tmp_path: Path):
         stop_logging(listener)
 
 
+def _worker_emit_debug_and_info() -> int:
+    """Worker task: log one DEBUG and one INFO record and return the PID."""
+    logging.getLogger("test.level").debug("worker-debug-detail")
+    logging.getLogger("test.level").info("worker-info-summary")
+    return os.getpid()
+
+
+def _worker_level_initializer(log_queue: mp.Queue, log_dir: str, level: int) -> None:
+    worker_log_initializer(log_queue, log_dir=Path(log_dir), level=level)
+
+
+def test_non_verbose_pipeline_log_omits_worker_debug(tmp_path: Path):
+    """Without --verbose, worker DEBUG records stay in worker_{pid}.log only."""
+    log_queue, listener = setup_main_logging(log_dir=tmp_path, verbose=False)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_worker_level_initializer,
+            initargs=(log_queue, str(tmp_path), logging.INFO),
+        ) as pool:
+            worker_pid = pool.submit(_worker_emit_debug_and_info).result(timeout=10)
+    finally:
+        stop_logging(listener)
+        for handler in listener.handlers:
+            handler.close()
+
+    pipeline_log = (tmp_path / "pipeline.log").read_text()
+    assert "worker-info-summary" in pipeline_log
+    assert "worker-debug-detail" not in pipeline_log
+    worker_log = (tmp_path / f"worker_{worker_pid}.log").read_text()
+    assert "worker-debug-detail" in worker_log
+    assert "worker-info-summary" in worker_log
+
+
 def test_stop_logging_idempotent():
     """stop_logging can be called multiple times without error."""
     _, listener = setup_main_logging()
     stop_logging(listener)
     stop_logging(listener)  # Should not raise
+
+
+def test_runs_sharing_a_queue_get_their_own_records(tmp_path: Path):
+    """Records on a shared queue go to the run they were logged for."""
+    log_queue = mp.Queue()
+    start_run_logging(log_queue, "a", log_dir=tmp_path / "a")
+    start_run_logging(log_queue, "b", log_dir=tmp_path / "b")
+    try:
+        worker_log_initializer(log_queue)
+        set_worker_run("a")
+        logging.getLogger("test.run").info("for-a")
+        set_worker_run("b")
+        logging.getLogger("test.run").info("for-b")
+    finally:
+        logging.getLogger().handlers.clear()
+
+    # Stopping one run flushes it without stopping the shared listener
+    stop_run_logging(log_queue, "a")
+    a_log = (tmp_path / "a" / "pipeline.log").read_text()
+    assert "for-a" in a_log
+    assert "for-b" not in a_log
+
+    stop_run_logging(log_queue, "b")
+    assert "for-b" in (tmp_path / "b" / "pipeline.log").read_text()
+
+
+def test_set_worker_run_swaps_worker_log_file(tmp_path: Path):
+    """A persistent worker writes each run's records to that run's log_dir."""
+    worker_log_initializer(mp.Queue())
+    try:
+        set_worker_run("a", tmp_path / "a")
+        logging.getLogger("test.run").info("first")
+        set_worker_run("b", tmp_path / "b")
+        logging.getLogger("test.run").info("second")
+    finally:
+        logging.getLogger().handlers.clear()
+
+    name = f"worker_{os.getpid()}.log"
+    assert "second" not in (tmp_path / "a" / name).read_text()
+    assert "second" in (tmp_path / "b" / name).read_text()
@@ -113,6 +113,18 @@ class TestCacheBehavior:
 
         mock_surya.assert_called_once_with(None)
 
+    def test_get_models_reloads_for_different_dtype(self, mock_surya):
+        """A dtype change replaces the cached set; the same dtype hits the cache."""
+        cache = ModelCache.get_instance()
+        cache.get_models(dtype="bf16")
+        cache.get_models(dtype="bf16")
+        assert mock_surya.call_count == 1
+        mock_surya.assert_called_with(None, dtype="bf16")
+
+        cache.get_models(dtype="fp16")
+        assert mock_surya.call_count == 2
+        assert cache.is_loaded() is True
+
     def test_is_loaded_returns_false_initially(self):
         """is_loaded returns False before any models are loaded."""
         cache = ModelCache.get_instance()
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import scholardoc_ocr.model_cache  # noqa: F401 - pre-import for patching
 import scholardoc_ocr.surya  # noqa: F401 - pre-import for patching
 from scholardoc_ocr.exceptions import SuryaError
@@ -115,6 +118,40 @@ def _mock_pool(futures: list[MagicMock]):
     return pool_ctx, mock_pool
 
 
+# A page with no text that draws an image, like a scan without a text layer
+_IMAGE_PAGE = None
+_CLEAN_TEXT = "The quick brown fox jumps over the lazy dog."
+
+
+def _write_pdf(path: Path, pages: list[str | None]) -> Path:
+    """Write a real PDF at *path* with one page per entry in *pages*.
+
+    A string becomes the page's text ("" leaves it blank); ``_IMAGE_PAGE``
+    draws a small image and no text.
+    """
+    import fitz
+
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        if text is _IMAGE_PAGE:
+            pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 8, 8), False)
+            page.insert_image(fitz.Rect(72, 72, 144, 144), pixmap=pix)
+        elif text:
+            page.insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def _fake_run_ocr(input_path: Path, output_path: Path, config):
+    """Stand-in for tesseract.run_ocr that copies the input through as its output."""
+    from scholardoc_ocr.tesseract import TesseractResult
+
+    shutil.copy(input_path, output_path)
+    return TesseractResult(success=True, output_path=output_path)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -224,6 +261,152 @@ class TestSuryaWriteback:
         mock_cache_instance.get_models.assert_called_once()
         mock_convert.assert_called_once()
 
+    @patch("scholardoc_ocr.surya.convert_pdf_with_fallback")
+    @patch("scholardoc_ocr.model_cache.ModelCache")
+    @patch("scholardoc_ocr.batch.create_combined_pdf")
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_next_sub_batch_pdf_built_ahead(
+        self, mock_pool_cls, mock_create_pdf, mock_cache_cls, mock_convert, tmp_path: Path
+    ):
+        """Each sub-batch gets its own combined PDF; later ones are built in the background."""
+        _create_mock_pdf(tmp_path / "input" / "doc.pdf")
+        config = _make_config(
+            tmp_path, files=["doc.pdf"], extract_text=True, surya_pages_per_call=1
+        )
+
+        result_fr = _flagged_file_result("doc.pdf", page_count=3, flagged_indices=[0, 2])
+        future = MagicMock()
+        future.result.return_value = result_fr
+        pool_ctx, pool = _mock_pool([future])
+        mock_pool_cls.return_value = pool_ctx
+
+        mock_cache_instance = MagicMock()
+        mock_cache_instance.get_models.return_value = ({"model": "mock"}, "mps")
+        mock_cache_cls.get_instance.return_value = mock_cache_instance
+        mock_convert.side_effect = [("SURYA_FIRST", False), ("SURYA_LAST", False)]
+        text_path = tmp_path / "output" / "final" / "doc.txt"
+        text_path.parent.mkdir(parents=True, exist_ok=True)
+        text_path.write_text("BAD_PAGE_0\n\npage1\n\nBAD_PAGE_2", encoding="utf-8")
+
+        with patch("scholardoc_ocr.pipeline.as_completed", return_value=iter([future])):
+            run_pipeline(config)
+
+        built = {
+            c.args[1].name: [fp.page_number for fp in c.args[0]]
+            for c in mock_create_pdf.call_args_list
+        }
+        assert built == {"_surya_batch_0.pdf": [0], "_surya_batch_1.pdf": [2]}
+        assert mock_convert.call_count == 2
+        updated = text_path.read_text(encoding="utf-8")
+        assert "SURYA_FIRST" in updated and "SURYA_LAST" in updated
+
+    @patch("scholardoc_ocr.surya.convert_pdf_with_fallback")
+    @patch("scholardoc_ocr.model_cache.ModelCache")
+    @patch("scholardoc_ocr.batch.create_combined_pdf")
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_no_rewrite_when_surya_returns_nothing(
+        self, mock_pool_cls, mock_create_pdf, mock_cache_cls, mock_convert, tmp_path: Path
+    ):
+        """An empty Surya result leaves the Tesseract .txt untouched."""
+        _create_mock_pdf(tmp_path / "input" / "doc.pdf")
+        config = _make_config(tmp_path, files=["doc.pdf"], extract_text=True)
+
+        result_fr = _flagged_file_result("doc.pdf", page_count=3, flagged_indices=[1])
+        future = MagicMock()
+        future.result.return_value = result_fr
+        pool_ctx, pool = _mock_pool([future])
+        mock_pool_cls.return_value = pool_ctx
+
+        final_dir = tmp_path / "output" / "final"
+        final_dir.mkdir(parents=True, exist_ok=True)
+        text_path = final_dir / "doc.txt"
+        text_path.write_text("TESSERACT_TXT", encoding="utf-8")
+
+        mock_cache_instance = MagicMock()
+        mock_cache_instance.get_models.return_value = ({"model": "mock"}, "mps")
+        mock_cache_cls.get_instance.return_value = mock_cache_instance
+        mock_convert.return_value = ("", False)
+
+        with patch("scholardoc_ocr.pipeline.as_completed", return_value=iter([future])):
+            run_pipeline(config)
+
+        assert text_path.read_text(encoding="utf-8") == "TESSERACT_TXT"
+
+    @patch("scholardoc_ocr.surya.convert_pdf_with_fallback")
+    @patch("scholardoc_ocr.model_cache.ModelCache")
+    @patch("scholardoc_ocr.batch.create_combined_pdf")
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_writeback_uses_page_texts_not_paragraphs(
+        self, mock_pool_cls, mock_create_pdf, mock_cache_cls, mock_convert, tmp_path: Path
+    ):
+        """A page containing blank lines does not shift which text Surya replaces."""
+        _create_mock_pdf(tmp_path / "input" / "doc.pdf")
+        config = _make_config(tmp_path, files=["doc.pdf"], extract_text=True)
+
+        result_fr = _flagged_file_result("doc.pdf", page_count=3, flagged_indices=[2])
+        result_fr.pages[0].text = "First paragraph.\n\nSecond paragraph."
+        future = MagicMock()
+        future.result.return_value = result_fr
+
+        pool_ctx, pool = _mock_pool([future])
+        mock_pool_cls.return_value = pool_ctx
+
+        final_dir = tmp_path / "output" / "final"
+        final_dir.mkdir(parents=True, exist_ok=True)
+        text_path = final_dir / "doc.txt"
+        text_path.write_text("stale", encoding="utf-8")
+
+        mock_cache_instance = MagicMock()
+        mock_cache_instance.get_models.return_value = ({"model": "mock"}, "mps")
+        mock_cache_cls.get_instance.return_value = mock_cache_instance
+        mock_convert.return_value = ("SURYA_PAGE_TWO", False)
+
+        with patch("scholardoc_ocr.pipeline.as_completed", return_value=iter([future])):
+            run_pipeline(config)
+
+        updated = text_path.read_text(encoding="utf-8")
+        assert "Second paragraph." in updated
+        assert "Good text on page 1" in updated
+        assert updated.rstrip().endswith("SURYA_PAGE_TWO")
+
+    @patch("scholardoc_ocr.postprocess.postprocess")
+    @patch("scholardoc_ocr.surya.convert_pdf_with_fallback")
+    @patch("scholardoc_ocr.model_cache.ModelCache")
+    @patch("scholardoc_ocr.batch.create_combined_pdf")
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_no_writeback_without_extract_text(
+        self,
+        mock_pool_cls,
+        mock_create_pdf,
+        mock_cache_cls,
+        mock_convert,
+        mock_postprocess,
+        tmp_path: Path,
+    ):
+        """The .txt is not rebuilt when it will be cleaned up at the end."""
+        _create_mock_pdf(tmp_path / "input" / "doc.pdf")
+        config = _make_config(tmp_path, files=["doc.pdf"])
+
+        future = MagicMock()
+        future.result.return_value = _flagged_file_result("doc.pdf", flagged_indices=[1])
+        pool_ctx, pool = _mock_pool([future])
+        mock_pool_cls.return_value = pool_ctx
+
+        final_dir = tmp_path / "output" / "final"
+        final_dir.mkdir(parents=True, exist_ok=True)
+        (final_dir / "doc.txt").write_text("page0\n\nBAD\n\npage2", encoding="utf-8")
+
+        mock_cache_instance = MagicMock()
+        mock_cache_instance.get_models.return_value = ({"model": "mock"}, "mps")
+        mock_cache_cls.get_instance.return_value = mock_cache_instance
+        mock_convert.return_value = ("SURYA", False)
+
+        with patch("scholardoc_ocr.pipeline.as_completed", return_value=iter([future])):
+            run_pipeline(config)
+
+        mock_postprocess.assert_not_called()
+        assert not (final_dir / "doc.txt").exists()
+
 
 class TestSuryaPartialFailure:
     """Test 4: Cross-file batch Surya failure does not crash the pipeline."""
@@ -324,30 +507,355 @@ class TestForceSurya:
         mock_convert.assert_called_once()
 
 
+class TestSuryaWarmup:
+    """torch is imported during Phase 1; models load once Phase 1 is done."""
+
+    @patch("scholardoc_ocr.surya.convert_pdf_with_fallback")
+    @patch("scholardoc_ocr.model_cache.ModelCache")
+    @patch("scholardoc_ocr.batch.create_combined_pdf")
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_memory_read_after_phase1(
+        self, mock_pool_cls, mock_create_pdf, mock_cache_cls, mock_convert, tmp_path: Path
+    ):
+        import threading
+
+        from scholardoc_ocr import batch
+
+        _create_mock_pdf(tmp_path / "input" / "bad.pdf")
+        _create_mock_pdf(tmp_path / "input" / "good.pdf")
+        config = _make_config(tmp_path, files=["bad.pdf", "good.pdf"])
+
+        future_bad = MagicMock()
+        future_bad.result.return_value = _flagged_file_result("bad.pdf", flagged_indices=[0])
+        future_good = MagicMock()
+        future_good.result.return_value = _good_file_result("good.pdf")
+
+        pool_ctx, pool = _mock_pool([future_bad, future_good])
+        mock_pool_cls.return_value = pool_ctx
+
+        events: list[str] = []
+        imported = threading.Event()
+        mock_cache_instance = MagicMock()
+
+        def _get_models(*args, **kwargs):
+            events.append("get_models")
+            return ({"model": "mock"}, "cpu")
+
+        mock_cache_instance.get_models.side_effect = _get_models
+        mock_cache_cls.get_instance.return_value = mock_cache_instance
+        mock_convert.return_value = ("SURYA_TEXT", False)
+
+        def _completed(_futures):
+            yield future_bad
+            events.append(f"warmup={imported.wait(timeout=5)}")
+            yield future_good
+            events.append("phase1_done")
+
+        def _pressure():
+            events.append("pressure")
+            return False, 16.0
+
+        def _configure(device, available_memory_gb=None):
+            events.append("configure")
+            return {}
+
+        with (
+            patch("scholardoc_ocr.pipeline.as_completed", side_effect=_completed),
+            patch("scholardoc_ocr.pipeline._preimport_torch", side_effect=imported.set),
+            patch.object(batch, "check_memory_pressure", side_effect=_pressure),
+            patch.object(batch, "configure_surya_batch_sizes", side_effect=_configure),
+        ):
+            run_pipeline(config)
+
+        assert events == ["warmup=True", "phase1_done", "pressure", "configure", "get_models"]
+
+
+class TestWorkerState:
+    """Per-process PDFProcessor/QualityAnalyzer reuse in Tesseract workers."""
+
+    def test_analyzer_reused_per_settings(self):
+        from scholardoc_ocr.pipeline import _get_worker_analyzer
+
+        a = _get_worker_analyzer(0.85, 20)
+        assert _get_worker_analyzer(0.85, 20) is a
+        assert _get_worker_analyzer(0.9, 20) is not a
+
+    def test_processor_reused(self):
+        from scholardoc_ocr.pipeline import _get_worker_processor
+
+        assert _get_worker_processor() is _get_worker_processor()
+
+    @pytest.mark.parametrize("keep", [False, True])
+    def test_tesseract_writes_final_pdf_unless_kept(self, tmp_path: Path, keep: bool):
+        from scholardoc_ocr.pipeline import _tesseract_worker
+
+        src = _write_pdf(tmp_path / "scan.pdf", [""])
+        out = tmp_path / "out"
+        with patch("scholardoc_ocr.tesseract.run_ocr", side_effect=_fake_run_ocr):
+            result = _tesseract_worker(
+                src,
+                out,
+                {
+                    "langs_tesseract": ["eng"],
+                    "quality_threshold": 0.85,
+                    "force_tesseract": True,
+                    "keep_intermediates": keep,
+                },
+            )
+
+        assert result.success
+        assert (out / "final" / "scan.pdf").exists()
+        assert (out / "work" / "scan" / "scan_tesseract.pdf").exists() is keep
+        assert (out / "work" / "scan").exists() is keep
+        assert list((out / "final").glob(".*.tmp")) == []
+
+    def test_failed_tesseract_leaves_no_final_pdf(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _tesseract_worker
+        from scholardoc_ocr.tesseract import TesseractResult
+
+        src = _write_pdf(tmp_path / "scan.pdf", [""])
+
+        def interrupted_run_ocr(input_path, output_path, config):
+            output_path.write_bytes(b"%PDF-1.7 truncated")
+            return TesseractResult(success=False, error="interrupted")
+
+        out = tmp_path / "out"
+        with patch("scholardoc_ocr.tesseract.run_ocr", side_effect=interrupted_run_ocr):
+            result = _tesseract_worker(
+                src,
+                out,
+                {"langs_tesseract": ["eng"], "quality_threshold": 0.85, "force_tesseract": True},
+            )
+
+        assert not result.success
+        assert list((out / "final").iterdir()) == []
+
+    def test_force_tesseract_skips_existing_text_pass(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _get_worker_processor, _tesseract_worker
+
+        src = _write_pdf(tmp_path / "born_digital.pdf", ["Existing text layer"])
+        processor = _get_worker_processor()
+        with (
+            patch("scholardoc_ocr.tesseract.run_ocr", side_effect=_fake_run_ocr),
+            patch.object(
+                processor, "extract_text_by_page", wraps=processor.extract_text_by_page
+            ) as spy,
+        ):
+            result = _tesseract_worker(
+                src,
+                tmp_path / "out",
+                {"langs_tesseract": ["eng"], "quality_threshold": 0.85, "force_tesseract": True},
+            )
+
+        assert result.success
+        assert result.page_count == 1
+        assert "extract_text" not in result.phase_timings
+        # Only the Tesseract output is read back
+        assert [c.args[0].name for c in spy.call_args_list] == ["born_digital.pdf"]
+        assert spy.call_args_list[0].args[0].parent.name == "final"
+
+    def test_existing_text_pass_stops_at_first_flagged_page(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _tesseract_worker
+        from scholardoc_ocr.quality import QualityAnalyzer
+
+        src = _write_pdf(
+            tmp_path / "scan.pdf",
+            ["Th3 qu1ck br0wn f0x jumpz ovr th lazzy d0g xkcq", _CLEAN_TEXT],
+        )
+        with (
+            patch("scholardoc_ocr.tesseract.run_ocr", side_effect=_fake_run_ocr),
+            patch.object(
+                QualityAnalyzer, "analyze", autospec=True, side_effect=QualityAnalyzer.analyze
+            ) as analyze,
+        ):
+            result = _tesseract_worker(
+                src, tmp_path / "out", {"langs_tesseract": ["eng"], "quality_threshold": 0.85}
+            )
+
+        assert result.engine == OCREngine.TESSERACT
+        assert result.page_count == 2
+        # One call for the first (flagged) existing page, then both Tesseract pages
+        assert analyze.call_count == 3
+
+    def test_existing_text_read_error_falls_back_to_tesseract(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _get_worker_processor, _tesseract_worker
+
+        src = _write_pdf(tmp_path / "scan.pdf", [_CLEAN_TEXT] * 3)
+
+        def broken_pages(pdf_path, image_check_chars=0):
+            yield _CLEAN_TEXT, False
+            raise RuntimeError("damaged xref")
+
+        processor = _get_worker_processor()
+        with (
+            patch("scholardoc_ocr.tesseract.run_ocr", side_effect=_fake_run_ocr) as run_ocr,
+            patch.object(processor, "iter_text_by_page", side_effect=broken_pages),
+        ):
+            result = _tesseract_worker(
+                src, tmp_path / "out", {"langs_tesseract": ["eng"], "quality_threshold": 0.85}
+            )
+
+        run_ocr.assert_called_once()
+        assert result.engine == OCREngine.TESSERACT
+        assert result.page_count == 3
+
+    def test_mostly_image_only_file_sent_to_tesseract(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _tesseract_worker
+
+        # The blank page without images still scores as neutral
+        src = _write_pdf(tmp_path / "scan.pdf", [_IMAGE_PAGE, _IMAGE_PAGE, ""])
+        with patch("scholardoc_ocr.tesseract.run_ocr", side_effect=_fake_run_ocr) as run_ocr:
+            result = _tesseract_worker(
+                src, tmp_path / "out", {"langs_tesseract": ["eng"], "quality_threshold": 0.85}
+            )
+
+        run_ocr.assert_called_once()
+        assert result.engine == OCREngine.TESSERACT
+
+    def test_image_cover_keeps_existing_text(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _tesseract_worker
+
+        src = _write_pdf(tmp_path / "book.pdf", [_IMAGE_PAGE] + [_CLEAN_TEXT] * 5)
+        with patch("scholardoc_ocr.tesseract.run_ocr") as run_ocr:
+            result = _tesseract_worker(
+                src, tmp_path / "out", {"langs_tesseract": ["eng"], "quality_threshold": 0.85}
+            )
+
+        run_ocr.assert_not_called()
+        assert result.engine == OCREngine.EXISTING
+        assert result.page_count == 6
+        # The cover is left for Phase 2 to OCR
+        assert [p.page_number for p in result.flagged_pages] == [0]
+
+    def test_few_image_only_pages_flagged_individually(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _tesseract_worker
+
+        pages = [_CLEAN_TEXT] * 10
+        pages[3] = pages[7] = _IMAGE_PAGE
+        src = _write_pdf(tmp_path / "book.pdf", pages)
+        with patch("scholardoc_ocr.tesseract.run_ocr") as run_ocr:
+            result = _tesseract_worker(
+                src, tmp_path / "out", {"langs_tesseract": ["eng"], "quality_threshold": 0.85}
+            )
+
+        run_ocr.assert_not_called()
+        assert result.engine == OCREngine.EXISTING
+        assert result.page_count == 10
+        assert [p.page_number for p in result.flagged_pages] == [3, 7]
+        assert all(p.status == PageStatus.FLAGGED for p in result.flagged_pages)
+
+    def test_planned_page_count_not_reprobed(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _get_worker_processor, _tesseract_worker
+
+        src = _write_pdf(tmp_path / "scan.pdf", ["", ""])
+        processor = _get_worker_processor()
+        with (
+            patch("scholardoc_ocr.tesseract.run_ocr", side_effect=_fake_run_ocr),
+            patch.object(processor, "get_page_count") as probe,
+        ):
+            result = _tesseract_worker(
+                src,
+                tmp_path / "out",
+                {
+                    "langs_tesseract": ["eng"],
+                    "quality_threshold": 0.85,
+                    "force_tesseract": True,
+                    "page_count": 2,
+                },
+            )
+
+        assert result.page_count == 2
+        probe.assert_not_called()
+
+
 class TestResourceAwareWorkers:
     """Test 6: Worker calculation respects CPU count and file count."""
 
     def test_resource_aware_workers_few_files(self):
         """8 cores, 2 files -> jobs_per_file=4, pool_workers=2."""
-        total_cores = 8
-        num_files = 2
-        max_workers = 4
-        jobs_per_file = max(1, total_cores // max(1, num_files))
-        pool_workers = max(1, min(max_workers, total_cores // jobs_per_file))
+        from scholardoc_ocr.pipeline import _plan_workers
+
+        assert _plan_workers(8, 2, 4, 64_000) == (4, 2)
 
-        assert jobs_per_file == 4
-        assert pool_workers == 2
+    def test_jobs_weighted_by_page_count(self):
+        """A 600-page book gets most cores next to a 10-page pamphlet."""
+        from scholardoc_ocr.pipeline import _jobs_by_page_count
+
+        assert _jobs_by_page_count([600, 10], 8) == [7, 1]
+        assert _jobs_by_page_count([100, 100], 8) == [4, 4]
+
+    def test_jobs_never_exceed_cores(self):
+        from scholardoc_ocr.pipeline import _jobs_by_page_count
+
+        assert _jobs_by_page_count([1000, 1, 1, 1], 8) == [5, 1, 1, 1]
+        assert _jobs_by_page_count([5, 5, 5], 2) == [1, 1, 1]
+
+    def test_jobs_even_split_when_page_counts_unknown(self):
+        from scholardoc_ocr.pipeline import _jobs_by_page_count
+
+        assert _jobs_by_page_count([0, 0], 8) == [4, 4]
 
     def test_resource_aware_workers_many_files(self):
         """8 cores, 16 files -> jobs_per_file=1, pool_workers=8 (capped)."""
-        total_cores = 8
-        num_files = 16
-        max_workers = 8
-        jobs_per_file = max(1, total_cores // max(1, num_files))
-        pool_workers = max(1, min(max_workers, total_cores // jobs_per_file))
+        from scholardoc_ocr.pipeline import _plan_workers
+
+        assert _plan_workers(8, 16, 8, 64_000) == (1, 8)
+
+    def test_queued_files_share_cores_among_running_workers(self):
+        """8 cores, 20 files, 4 workers -> 2 jobs each, not 1 (4 idle cores)."""
+        from scholardoc_ocr.pipeline import _plan_workers
+
+        assert _plan_workers(8, 20, 4, 64_000) == (2, 4)
 
-        assert jobs_per_file == 1
-        assert pool_workers == 8
+    def test_workers_capped_by_memory(self):
+        """8 cores, 8 files, 1200 MB -> 2 workers with 4 jobs each, no idle cores."""
+        from scholardoc_ocr.pipeline import _plan_workers
+
+        assert _plan_workers(8, 8, 8, 1200) == (4, 2)
+
+    def test_usable_cpu_count_respects_affinity(self, monkeypatch):
+        from scholardoc_ocr import pipeline
+
+        monkeypatch.setattr(pipeline.os, "sched_getaffinity", lambda pid: {0, 1}, raising=False)
+        monkeypatch.setattr(pipeline.os, "cpu_count", lambda: 64)
+        assert pipeline._usable_cpu_count() == 2
+
+    def test_available_memory_clamped_to_cgroup_limit(self, tmp_path: Path, monkeypatch):
+        from scholardoc_ocr import pipeline
+
+        mib = 1024 * 1024
+        (tmp_path / "memory.max").write_text(f"{2048 * mib}\n")
+        (tmp_path / "memory.current").write_text(f"{1024 * mib}\n")
+        monkeypatch.setattr(pipeline, "_CGROUP_DIR", tmp_path)
+        assert pipeline._available_memory_mb() <= 1024
+
+        (tmp_path / "memory.max").write_text("max\n")
+        assert pipeline._available_memory_mb() > 0
+
+
+class TestSubmissionOrder:
+    """Queued files are submitted largest first."""
+
+    @patch("scholardoc_ocr.pipeline.ProcessPoolExecutor")
+    def test_largest_files_submitted_first_when_queued(self, mock_pool_cls, tmp_path: Path):
+        for name, size in [("a.pdf", 10), ("b.pdf", 300), ("c.pdf", 50)]:
+            (tmp_path / "input").mkdir(exist_ok=True)
+            (tmp_path / "input" / name).write_bytes(b"%" * size)
+        config = _make_config(tmp_path, max_workers=1)
+
+        futures = []
+        for name in ("b.pdf", "c.pdf", "a.pdf"):
+            future = MagicMock()
+            future.result.return_value = _good_file_result(name)
+            futures.append(future)
+        pool_ctx, pool = _mock_pool(futures)
+        mock_pool_cls.return_value = pool_ctx
+
+        with patch("scholardoc_ocr.pipeline.as_completed", return_value=iter(futures)):
+            run_pipeline(config)
+
+        submitted = [c.args[1].name for c in pool.submit.call_args_list]
+        assert submitted == ["b.pdf", "c.pdf", "a.pdf"]
 
 
 class TestEmptyInput:
@@ -531,3 +1039,243 @@ class TestMetricsFixes:
         # This is a documentation/contract test - actual values tested in integration
         for key in expected_keys:
             assert isinstance(key, str)
+
+
+class TestCleanupSweep:
+    """Parallel removal of final .txt files."""
+
+    def test_remove_all_files(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _remove_all
+
+        for i in range(5):
+            (tmp_path / f"doc{i}.txt").write_text("x", encoding="utf-8")
+        keep = tmp_path / "doc0.pdf"
+        keep.write_bytes(b"%PDF")
+
+        _remove_all(tmp_path.glob("*.txt"))
+
+        assert list(tmp_path.glob("*.txt")) == []
+        assert keep.exists()
+
+
+class TestFormatError:
+    """FileResult error text carries a traceback only at DEBUG."""
+
+    def test_traceback_only_when_debug(self, caplog):
+        import logging
+
+        from scholardoc_ocr.pipeline import _format_error
+
+        try:
+            raise ValueError("bad page")
+        except ValueError as exc:
+            with caplog.at_level(logging.INFO, logger="scholardoc_ocr.pipeline"):
+                assert _format_error(exc) == "ValueError: bad page"
+            with caplog.at_level(logging.DEBUG, logger="scholardoc_ocr.pipeline"):
+                assert "Traceback" in _format_error(exc)
+
+
+class TestAtomicWrites:
+    """Final outputs are written via temp file + rename."""
+
+    def test_write_text_atomic_replaces_without_leftovers(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _copy_atomic, _write_text_atomic
+
+        target = tmp_path / "doc.txt"
+        target.write_text("old", encoding="utf-8")
+        _write_text_atomic(target, "new – text")
+        assert target.read_text(encoding="utf-8") == "new – text"
+
+        src = tmp_path / "in.pdf"
+        src.write_bytes(b"%PDF-1.7")
+        _copy_atomic(src, tmp_path / "doc.pdf")
+        assert (tmp_path / "doc.pdf").read_bytes() == b"%PDF-1.7"
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["doc.pdf", "doc.txt", "in.pdf"]
+
+    def test_unchanged_outputs_not_rewritten(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _copy_atomic, _write_text_atomic
+
+        target = tmp_path / "doc.txt"
+        _write_text_atomic(target, "same text")
+        src = tmp_path / "in.pdf"
+        src.write_bytes(b"%PDF-1.7")
+        dest = tmp_path / "doc.pdf"
+        _copy_atomic(src, dest)
+
+        with patch("scholardoc_ocr.pipeline.os.replace") as replace:
+            _write_text_atomic(target, "same text")
+            _copy_atomic(src, dest)
+        replace.assert_not_called()
+
+        src.write_bytes(b"%PDF-1.7 changed")
+        _copy_atomic(src, dest)
+        assert dest.read_bytes() == b"%PDF-1.7 changed"
+
+    def test_copy_uses_clone_when_supported(self, tmp_path: Path):
+        from scholardoc_ocr.pipeline import _copy_atomic
+
+        src = tmp_path / "in.pdf"
+        src.write_bytes(b"%PDF-1.7")
+
+        def fake_clone(s: Path, d: Path) -> bool:
+            d.write_bytes(s.read_bytes())
+            return True
+
+        with (
+            patch("scholardoc_ocr.pipeline._clone_file", side_effect=fake_clone) as clone,
+            patch("scholardoc_ocr.pipeline.shutil.copy2") as copy2,
+        ):
+            _copy_atomic(src, tmp_path / "doc.pdf")
+
+        clone.assert_called_once()
+        copy2.assert_not_called()
+        assert (tmp_path / "doc.pdf").stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+class TestPrefetch:
+    """posix_fadvise read-ahead of queued input PDFs."""
+
+    def test_prefetch_advises_each_file(self, tmp_path: Path, monkeypatch):
+        from scholardoc_ocr import pipeline
+
+        advised = []
+        monkeypatch.setattr(
+            pipeline.os, "posix_fadvise", lambda fd, *a: advised.append(a), raising=False
+        )
+        monkeypatch.setattr(pipeline.os, "POSIX_FADV_WILLNEED", 3, raising=False)
+        files = [tmp_path / f"doc{i}.pdf" for i in range(3)]
+        for f in files:
+            f.write_bytes(b"%PDF")
+
+        pipeline._prefetch([*files, tmp_path / "missing.pdf"])
+
+        assert advised == [(0, 0, 3)] * 3
+
+    def test_prefetch_noop_without_fadvise(self, tmp_path: Path, monkeypatch):
+        from scholardoc_ocr import pipeline
+
+        monkeypatch.delattr(pipeline.os, "posix_fadvise", raising=False)
+        pipeline._prefetch([tmp_path / "doc.pdf"])
+
+
+class TestPersistentPool:
+    """reuse_pool keeps one Tesseract pool across run_pipeline calls."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_pool(self):
+        from scholardoc_ocr import pipeline
+
+        yield
+        pipeline._POOL = None
+        pipeline._POOL_MAX_WORKERS = 0
+        pipeline._POOL_WORKERS = 0
+        pipeline._POOL_USERS = 0
+
+    def test_pool_reused_for_same_worker_count(self):
+        from scholardoc_ocr import pipeline
+
+        with patch("scholardoc_ocr.pipeline.ProcessPoolExecutor") as mock_pool_cls:
+            mock_pool_cls.side_effect = lambda **kw: MagicMock(_broken=False)
+            first = pipeline._acquire_pool(2, 2, 2)
+            assert pipeline._acquire_pool(2, 2, 2) is first
+            assert mock_pool_cls.call_count == 1
+            pipeline._release_pool(first)
+            pipeline._release_pool(first)
+
+            # Idle, so a different configured maximum replaces it
+            second = pipeline._acquire_pool(3, 3, 3)
+            assert second is not first
+            first.shutdown.assert_called_once_with(wait=True)
+
+            pipeline.shutdown_pool()
+            second.shutdown.assert_called_once()
+            assert pipeline._POOL is None
+
+    def test_held_pool_not_replaced(self):
+        from scholardoc_ocr import pipeline
+
+        with patch("scholardoc_ocr.pipeline.ProcessPoolExecutor") as mock_pool_cls:
+            mock_pool_cls.side_effect = lambda **kw: MagicMock(_broken=False)
+            first = pipeline._acquire_pool(2, 2, 2)
+            assert pipeline._acquire_pool(3, 3, 3) is None
+            first.shutdown.assert_not_called()
+
+            # An interrupted run does not tear down a pool another run holds
+            pipeline._acquire_pool(2, 2, 2)
+            pipeline._release_pool(first, cancel=True)
+            first.shutdown.assert_not_called()
+            pipeline._release_pool(first, cancel=True)
+            first.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+            assert pipeline._POOL is None
+
+    def test_broken_pool_replaced(self):
+        from scholardoc_ocr import pipeline
+
+        with patch("scholardoc_ocr.pipeline.ProcessPoolExecutor") as mock_pool_cls:
+            mock_pool_cls.side_effect = lambda **kw: MagicMock(_broken=False)
+            first = pipeline._acquire_pool(2, 2, 2)
+            first._broken = "worker died"
+            assert pipeline._acquire_pool(2, 2, 2) is not first
+            first.shutdown.assert_called_once_with(wait=False)
+
+    def test_pool_sized_for_configured_maximum(self):
+        """Runs with fewer files share the pool instead of resizing it."""
+        from scholardoc_ocr import pipeline
+
+        with patch("scholardoc_ocr.pipeline.ProcessPoolExecutor") as mock_pool_cls:
+            mock_pool_cls.side_effect = lambda **kw: MagicMock(_broken=False)
+            first = pipeline._acquire_pool(4, 4, 1)
+            mock_pool_cls.assert_called_once()
+            assert mock_pool_cls.call_args.kwargs["max_workers"] == 4
+            assert pipeline._acquire_pool(4, 4, 4) is first
+            assert pipeline._acquire_pool(4, 4, 2) is first
+            assert mock_pool_cls.call_count == 1
+
+    def test_pool_too_small_rebuilt_when_idle(self):
+        """A pool started under memory pressure grows once it is free."""
+        from scholardoc_ocr import pipeline
+
+        with patch("scholardoc_ocr.pipeline.ProcessPoolExecutor") as mock_pool_cls:
+            mock_pool_cls.side_effect = lambda **kw: MagicMock(_broken=False)
+            first = pipeline._acquire_pool(4, 2, 2)
+            assert pipeline._acquire_pool(4, 4, 4) is None
+            pipeline._release_pool(first)
+            second = pipeline._acquire_pool(4, 4, 4)
+            assert second is not first
+            assert mock_pool_cls.call_args.kwargs["max_workers"] == 4
+
+    def test_run_pipeline_leaves_pool_running(self, tmp_path: Path):
+        from scholardoc_ocr import pipeline
+
+        config = _make_config(tmp_path, reuse_pool=True)
+        _create_mock_pdf(config.input_dir / "doc.pdf")
+        future = MagicMock()
+        future.result.return_value = _good_file_result("doc.pdf")
+        executor = MagicMock(_broken=False)
+        executor.submit.side_effect = [future]
+
+        with (
+            patch("scholardoc_ocr.pipeline.ProcessPoolExecutor", return_value=executor),
+            patch("scholardoc_ocr.pipeline.as_completed", return_value=[future]),
+        ):
+            batch = run_pipeline(config)
+
+        assert batch.files[0].success
+        executor.shutdown.assert_not_called()
+        assert pipeline._POOL is executor
+        assert pipeline._POOL_USERS == 0
+        # Keyed on the configured maximum, not on this run's single file
+        assert pipeline._POOL_MAX_WORKERS == config.max_workers
+        # Workers are told which run's log handlers to use
+        assert executor.submit.call_args.args[3]["log_run"]
+
+    def test_pool_context_forkserver_on_linux_only(self, monkeypatch):
+        import multiprocessing as mp
+
+        from scholardoc_ocr import pipeline
+
+        monkeypatch.setattr(pipeline.sys, "platform", "linux")
+        assert pipeline._pool_context().get_start_method() == "forkserver"
+        monkeypatch.setattr(pipeline.sys, "platform", "darwin")
+        assert pipeline._pool_context() is mp.get_context()
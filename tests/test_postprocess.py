@@ -104,6 +104,11 @@ class TestNormalizePunctuation:
     def test_trailing_whitespace_stripped(self):
         assert normalize_punctuation("hello   \n") == "hello\n"
 
+    def test_long_whitespace_run(self):
+        # Rescanning from every position inside the run took seconds here
+        run = " \t" * 20000 + "\n" * 20000
+        assert normalize_punctuation("a" + run + "x") == "a" + "\n" * 20000 + "x"
+
 
 # --- Integration: postprocess pipeline ---
 
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from scholardoc_ocr.processor import PDFProcessor
 
 
@@ -19,6 +21,35 @@ def test_extract_text_by_page(sample_pdf: Path):
     assert "page two" in pages[1]
 
 
+def test_iter_text_by_page(sample_pdf: Path, tmp_path: Path):
+    proc = PDFProcessor()
+    pages = proc.iter_text_by_page(sample_pdf)
+    text, image_only = next(pages)
+    assert "page one" in text
+    assert image_only is False
+    pages.close()
+
+    with pytest.raises(RuntimeError):
+        list(proc.iter_text_by_page(tmp_path / "missing.pdf"))
+
+
+def test_iter_text_by_page_flags_image_only_pages(sample_pdf: Path, tmp_path: Path):
+    import fitz
+
+    scan = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 8, 8), False)
+    doc.new_page().insert_image(fitz.Rect(72, 72, 144, 144), pixmap=pix)
+    doc.new_page()
+    doc.save(scan)
+    doc.close()
+
+    proc = PDFProcessor()
+    assert [flag for _, flag in proc.iter_text_by_page(scan, 30)] == [True, False]
+    assert [flag for _, flag in proc.iter_text_by_page(scan)] == [False, False]
+    assert [flag for _, flag in proc.iter_text_by_page(sample_pdf, 30)] == [False, False]
+
+
 def test_extract_pages(sample_pdf: Path, tmp_path: Path):
     proc = PDFProcessor()
     out = tmp_path / "extracted.pdf"
@@ -29,11 +60,32 @@ def test_extract_pages(sample_pdf: Path, tmp_path: Path):
     assert "page one" in text
 
 
+def test_extract_pages_keeps_requested_order(sample_pdf: Path, tmp_path: Path):
+    proc = PDFProcessor()
+    out = tmp_path / "extracted.pdf"
+    assert proc.extract_pages(sample_pdf, [1, 0, 1, 5], out) is True
+    pages = proc.extract_text_by_page(out)
+    assert len(pages) == 3
+    assert "page two" in pages[0]
+    assert "page one" in pages[1]
+    assert "page two" in pages[2]
+
+
 def test_get_page_count(sample_pdf: Path):
     proc = PDFProcessor()
     assert proc.get_page_count(sample_pdf) == 2
 
 
+def test_get_page_count_tracks_file_changes(sample_pdf: Path, tmp_path: Path):
+    proc = PDFProcessor()
+    target = tmp_path / "doc.pdf"
+    proc.extract_pages(sample_pdf, [0, 1], target)
+    assert proc.get_page_count(target) == 2
+
+    proc.extract_pages(sample_pdf, [0], target)
+    assert proc.get_page_count(target) == 1
+
+
 def test_extract_text_empty_pdf(empty_pdf: Path):
     proc = PDFProcessor()
     text = proc.extract_text(empty_pdf)
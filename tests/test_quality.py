@@ -271,6 +271,35 @@ class TestEdgeCases:
         r = q.analyze(text)
         assert r.flagged is False
 
+    def test_combined_reference_regex_matches_pattern_list(self):
+        from scholardoc_ocr.quality import _GarbledSignal
+
+        words = [
+            "42", "1999", "12-14", "xiv", "XIV", "A12", "3b", "isbn978", "ISBN",
+            "3.14", "ABC1", "pp.12", "P. 4", "(3)", "[7]", "§2", "12a-13b", "1-2-3",
+            "1/2.3", "word", "Xivy", "a1", "(a)", "1.", "pp", "§",
+        ]
+        for word in words:
+            expected = any(p.match(word) for p in _GarbledSignal.VALID_PATTERNS)
+            assert bool(_GarbledSignal._VALID_RE.match(word)) is expected, word
+
+    def test_combined_garbled_regex_matches_pattern_list(self):
+        from scholardoc_ocr.quality import _GarbledSignal
+
+        words = [
+            "strngths", "STRNGTHS", "McDonald", "wOrd", "a\x07b", "##%", "ok", "plain",
+            "Zeitlichkeit", "§§§x",
+        ]
+        for word in words:
+            for german_suffix in (False, True):
+                expected = any(
+                    p.search(word)
+                    for p, ptype in _GarbledSignal.PATTERNS
+                    if not (german_suffix and ptype == "consonant_cluster")
+                )
+                combined = _GarbledSignal._ANY_PATTERN[german_suffix]
+                assert bool(combined.search(word)) is expected, (word, german_suffix)
+
 
 # --- Language configuration ---
 
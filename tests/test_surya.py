@@ -89,6 +89,36 @@ class TestLoadModels:
         assert result == fake_models
         mock_torch.device.assert_called_once_with("cuda:0")
 
+    def test_with_dtype(self):
+        mock_create = MagicMock(return_value={"model": "fake"})
+        mock_torch = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "marker": MagicMock(),
+                "marker.models": MagicMock(create_model_dict=mock_create),
+                "torch": mock_torch,
+            },
+        ):
+            import importlib
+
+            import scholardoc_ocr.surya as surya_mod
+
+            importlib.reload(surya_mod)
+
+            model_dict, device = surya_mod.load_models(device="cuda", dtype="bf16")
+
+        assert model_dict == {"model": "fake"}
+        assert device == "cuda"
+        assert mock_create.call_args[1]["dtype"] is mock_torch.bfloat16
+
+    def test_unknown_dtype_raises_surya_error(self):
+        import scholardoc_ocr.surya as surya_mod
+
+        with pytest.raises(SuryaError, match="Unsupported Surya dtype"):
+            surya_mod.load_models(device="cpu", dtype="int4")
+
     def test_failure_raises_surya_error(self):
         mock_create = MagicMock(side_effect=RuntimeError("GPU OOM"))
 
@@ -216,6 +246,54 @@ class TestConvertPdf:
             with pytest.raises(SuryaError, match="conversion failed"):
                 surya_mod.convert_pdf(fake_pdf, {"m": "fake"})
 
+    def test_reuses_converter_for_same_models(self, tmp_path: Path):
+        fake_pdf = tmp_path / "test.pdf"
+        fake_pdf.write_bytes(b"%PDF-fake")
+
+        mock_output = MagicMock()
+        mock_output.markdown = "text"
+
+        mock_converter_cls = MagicMock()
+        mock_converter_cls.return_value = MagicMock(return_value=mock_output)
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "marker": MagicMock(),
+                "marker.converters": MagicMock(),
+                "marker.converters.pdf": MagicMock(PdfConverter=mock_converter_cls),
+                "marker.renderers": MagicMock(),
+                "marker.renderers.markdown": MagicMock(),
+            },
+        ):
+            import importlib
+
+            import scholardoc_ocr.surya as surya_mod
+
+            importlib.reload(surya_mod)
+
+            models = {"m": "fake"}
+            converters: dict = {}
+            surya_mod.convert_pdf(fake_pdf, models, converters=converters)
+            surya_mod.convert_pdf(fake_pdf, models, converters=converters)
+            assert mock_converter_cls.call_count == 1
+
+            # Different models (e.g. CPU fallback) or languages build a new one
+            cpu_models = {"m": "cpu"}
+            surya_mod.convert_pdf(fake_pdf, cpu_models, converters=converters)
+            surya_mod.convert_pdf(
+                fake_pdf,
+                cpu_models,
+                config=surya_mod.SuryaConfig(langs="en"),
+                converters=converters,
+            )
+            assert mock_converter_cls.call_count == 3
+
+            # Without a caller-owned cache nothing is kept between calls
+            surya_mod.convert_pdf(fake_pdf, models)
+            surya_mod.convert_pdf(fake_pdf, models)
+            assert mock_converter_cls.call_count == 5
+
 
 class TestLazyImports:
     def test_no_torch_or_marker_on_import(self):